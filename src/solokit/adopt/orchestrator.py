@@ -7,7 +7,10 @@ Implements the complete adoption flow without template installation.
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from solokit.adopt.doc_appender import append_to_claude_md, append_to_readme
@@ -162,6 +165,12 @@ SKIP_DIRECTORIES = {
     "__pycache__",
 }
 
+# Upper bound on threads used to install tier config files concurrently
+MAX_INSTALL_WORKERS = 8
+
+# Set this environment variable to install tier config files sequentially
+NO_PARALLEL_ENV_VAR = "SOLOKIT_NO_PARALLEL"
+
 
 def _get_tier_order() -> list[str]:
     """Return tiers in order from lowest to highest."""
@@ -191,7 +200,7 @@ def _get_tiers_up_to(tier: str) -> list[str]:
     return all_tiers[: tier_index + 1]
 
 
-def _normalize_path(relative_path: Path) -> str:
+def _normalize_path(relative_path: Path | str) -> str:
     """
     Normalize a path to use forward slashes for consistent matching.
 
@@ -201,21 +210,21 @@ def _normalize_path(relative_path: Path) -> str:
     Returns:
         Normalized path string with forward slashes
     """
-    return str(relative_path).replace("\\", "/")
+    return os.fspath(relative_path).replace("\\", "/")
 
 
-def _is_config_file(file_path: Path, relative_path: Path | None = None) -> bool:
+def _is_config_file(file_path: Path | str, relative_path: Path | str | None = None) -> bool:
     """
     Check if a file is a config file that should be processed.
 
     Args:
-        file_path: Path to the file
+        file_path: Path to the file, or its bare filename
         relative_path: Optional relative path for nested file matching
 
     Returns:
         True if file should be processed
     """
-    filename = file_path.name
+    filename = file_path if isinstance(file_path, str) else file_path.name
 
     # Check template files first (they have specific filenames)
     if filename in ALL_TEMPLATE_FILES:
@@ -307,6 +316,96 @@ def _get_output_filename(template_filename: str) -> str:
     return output_name
 
 
+@functools.lru_cache(maxsize=16)
+def _enumerate_tier_files(template_dir: Path, tier: str) -> tuple[tuple[str, Path, Path], ...]:
+    """
+    List the config files a template provides up to a tier.
+
+    Walks the base directory first and then each tier directory in order,
+    pruning source directories before descending into them. Each output
+    file is resolved to a single source as it is found: the first source
+    seen for an output name wins, so overridden files in later tiers are
+    dropped here rather than by every consumer. Results are cached per
+    template directory and tier, so previewing and then installing a tier
+    walks the tree once.
+
+    Args:
+        template_dir: Template root directory
+        tier: Target tier (cumulative)
+
+    Returns:
+        Tuple of (output_name, file_path, relative_path) entries in install order
+    """
+    files: dict[str, tuple[str, Path, Path]] = {}
+    for subdir in ["base", *_get_tiers_up_to(tier)]:
+        source_dir = template_dir / subdir
+        if not source_dir.exists():
+            continue
+
+        for dirpath, dirnames, filenames in os.walk(source_dir):
+            # Prune source directories so their contents are never listed
+            dirnames[:] = [name for name in dirnames if name not in SKIP_DIRECTORIES]
+            # Match on plain strings; Path objects are only built for config files
+            relative_dir = os.path.relpath(dirpath, source_dir)
+            for filename in filenames:
+                relative_name = (
+                    filename if relative_dir == "." else os.path.join(relative_dir, filename)
+                )
+                if not _is_config_file(filename, relative_name):
+                    continue
+                output_name = _get_output_filename(filename)
+                if output_name not in files:
+                    files[output_name] = (
+                        output_name,
+                        Path(dirpath, filename),
+                        Path(relative_name),
+                    )
+
+    return tuple(files.values())
+
+
+def _is_unchanged_copy(src_path: Path, output_path: Path) -> bool:
+    """
+    Check whether an output file is an untouched copy of its source.
+
+    Direct config files are installed with shutil.copy2, which preserves the
+    source modification time. A matching size and mtime therefore means the
+    file was installed earlier and not edited since.
+
+    Args:
+        src_path: Source file path
+        output_path: Installed file path
+
+    Returns:
+        True if the output file matches the source's size and mtime
+    """
+    try:
+        src_stat = src_path.stat()
+        output_stat = output_path.stat()
+    except OSError:
+        return False
+
+    return (
+        src_stat.st_size == output_stat.st_size and src_stat.st_mtime_ns == output_stat.st_mtime_ns
+    )
+
+
+def _render_template(src_path: Path, replacements: dict[str, str]) -> str:
+    """
+    Read a template file and substitute its placeholders.
+
+    Args:
+        src_path: Template file path
+        replacements: Placeholder replacements
+
+    Returns:
+        Rendered template content
+    """
+    from solokit.init.template_installer import replace_placeholders
+
+    return replace_placeholders(src_path.read_text(), replacements)
+
+
 def _install_config_file(
     src_path: Path,
     project_root: Path,
@@ -314,6 +413,7 @@ def _install_config_file(
     replacements: dict[str, str],
     backup_dir: Path | None = None,
     dry_run: bool = False,
+    force: bool = False,
 ) -> tuple[bool, str]:
     """
     Install a single config file with category-aware handling.
@@ -325,6 +425,7 @@ def _install_config_file(
         replacements: Placeholder replacements
         backup_dir: Directory for backups (if any)
         dry_run: If True, don't make changes, just report what would happen
+        force: If True, reinstall direct config files even when unchanged
 
     Returns:
         Tuple of (success: bool, action: str)
@@ -338,9 +439,12 @@ def _install_config_file(
     from solokit.adopt.merge_strategies import merge_config_file
 
     filename = src_path.name
+    # Templates are recognised by name alone; file contents are only read
+    # once we know they are needed (substitution or merge).
+    is_template = filename.endswith(".template")
 
     # Determine output path and filename
-    if filename.endswith(".template"):
+    if is_template:
         output_name = _get_output_filename(filename)
         output_path = project_root / relative_path.parent / output_name
         category_filename = output_name
@@ -366,6 +470,10 @@ def _install_config_file(
         logger.info(f"SKIP (exists): {category_filename} - already exists")
         return (True, "skipped_exists")
 
+    if file_exists and not is_template and not force and _is_unchanged_copy(src_path, output_path):
+        logger.info(f"SKIP (unchanged): {category_filename} - already up to date")
+        return (True, "skipped_exists")
+
     # Dry run handling
     if dry_run:
         if file_exists and category == "merge":
@@ -378,16 +486,12 @@ def _install_config_file(
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Read and process source content
-        if filename.endswith(".template"):
-            content = src_path.read_text()
-            for placeholder, value in replacements.items():
-                content = content.replace(f"{{{placeholder}}}", value)
-        else:
-            content = src_path.read_text()
-
         # Handle merge case
         if category == "merge" and file_exists:
+            if is_template:
+                content = _render_template(src_path, replacements)
+            else:
+                content = src_path.read_text()
             if backup_dir:
                 backup_file(output_path, backup_dir)
             merged_content = merge_config_file(category_filename, output_path, content)
@@ -399,8 +503,14 @@ def _install_config_file(
         if file_exists and backup_dir:
             backup_file(output_path, backup_dir)
 
-        if filename.endswith(".template"):
-            output_path.write_text(content)
+        # Neither direct config files nor templates need a decode/encode
+        # round-trip: templates are substituted as bytes.
+        if is_template:
+            from solokit.init.template_installer import replace_placeholders_in_bytes
+
+            output_path.write_bytes(
+                replace_placeholders_in_bytes(src_path.read_bytes(), replacements)
+            )
         else:
             shutil.copy2(src_path, output_path)
 
@@ -448,6 +558,7 @@ def install_tier_configs(
     coverage_target: int,
     backup_dir: Path | None = None,
     dry_run: bool = False,
+    force: bool = False,
 ) -> dict[str, list[str]]:
     """
     Install tier-specific configuration files for adoption.
@@ -457,6 +568,9 @@ def install_tier_configs(
     - MERGE_IF_EXISTS files are intelligently merged
     - INSTALL_IF_MISSING files only install if missing
 
+    Files are installed on a small thread pool; set SOLOKIT_NO_PARALLEL=1
+    to install them one at a time.
+
     Args:
         template_id: Template to use for configs (e.g., "saas_t3")
         tier: Target tier (e.g., "tier-2-standard")
@@ -464,6 +578,7 @@ def install_tier_configs(
         coverage_target: Coverage target for template replacements
         backup_dir: Directory for backups
         dry_run: If True, don't make changes
+        force: If True, reinstall config files that are already up to date
 
     Returns:
         Dict with keys: "installed", "merged", "skipped_exists",
@@ -488,68 +603,32 @@ def install_tier_configs(
         "errors": [],
     }
 
-    # Track processed files to avoid duplicates across tiers
-    processed_files: set[str] = set()
-
-    # Get tiers to install (cumulative)
-    tiers_to_install = _get_tiers_up_to(tier)
-
-    # Install from base directory first
-    base_dir = template_dir / "base"
-    if base_dir.exists():
-        for file_path in base_dir.rglob("*"):
-            if file_path.is_dir():
-                continue
-            # Skip files in source directories
-            relative_path = file_path.relative_to(base_dir)
-            if any(part in SKIP_DIRECTORIES for part in relative_path.parts):
-                continue
-            if _is_config_file(file_path, relative_path):
-                # Get display name for tracking
-                display_name = _get_output_filename(file_path.name)
-                if display_name in processed_files:
-                    continue
-                processed_files.add(display_name)
-
-                success, action = _install_config_file(
-                    file_path,
-                    project_root,
-                    relative_path,
-                    replacements,
-                    backup_dir=backup_dir,
-                    dry_run=dry_run,
-                )
-                _categorize_result(results, action, display_name)
+    # Install from base directory first, then each tier directory (cumulative).
+    # Files are already de-duplicated across tiers by output name.
+    entries = _enumerate_tier_files(template_dir, tier)
 
-    # Install from each tier directory (cumulative)
-    for install_tier in tiers_to_install:
-        tier_dir = template_dir / install_tier
-        if not tier_dir.exists():
-            continue
+    def _install(entry: tuple[str, Path, Path]) -> tuple[bool, str]:
+        _, file_path, relative_path = entry
+        return _install_config_file(
+            file_path,
+            project_root,
+            relative_path,
+            replacements,
+            backup_dir=backup_dir,
+            dry_run=dry_run,
+            force=force,
+        )
 
-        for file_path in tier_dir.rglob("*"):
-            if file_path.is_dir():
-                continue
-            # Skip files in source directories
-            relative_path = file_path.relative_to(tier_dir)
-            if any(part in SKIP_DIRECTORIES for part in relative_path.parts):
-                continue
-            if _is_config_file(file_path, relative_path):
-                # Get display name for tracking
-                display_name = _get_output_filename(file_path.name)
-                if display_name in processed_files:
-                    continue
-                processed_files.add(display_name)
-
-                success, action = _install_config_file(
-                    file_path,
-                    project_root,
-                    relative_path,
-                    replacements,
-                    backup_dir=backup_dir,
-                    dry_run=dry_run,
-                )
-                _categorize_result(results, action, display_name)
+    # Every entry writes a distinct output file, so installs are independent
+    # and their file I/O can overlap. Results are collected in install order.
+    if len(entries) > 1 and not os.environ.get(NO_PARALLEL_ENV_VAR):
+        with ThreadPoolExecutor(max_workers=min(MAX_INSTALL_WORKERS, len(entries))) as pool:
+            outcomes = list(pool.map(_install, entries))
+    else:
+        outcomes = [_install(entry) for entry in entries]
+
+    for (display_name, _, _), (_success, action) in zip(entries, outcomes):
+        _categorize_result(results, action, display_name)
 
     return results
 
@@ -574,54 +653,12 @@ def get_config_files_to_install(template_id: str, tier: str) -> list[str]:
     except Exception:
         return []
 
-    config_files: set[str] = set()
-    tiers_to_install = _get_tiers_up_to(tier)
-
-    # Check base directory
-    base_dir = template_dir / "base"
-    if base_dir.exists():
-        for file_path in base_dir.rglob("*"):
-            if file_path.is_dir():
-                continue
-            relative_path = file_path.relative_to(base_dir)
-            if any(part in SKIP_DIRECTORIES for part in relative_path.parts):
-                continue
-            if _is_config_file(file_path):
-                name = file_path.name
-                if name.endswith(".template"):
-                    name = (
-                        name.replace(".template", "")
-                        .replace(".tier1", "")
-                        .replace(".tier2", "")
-                        .replace(".tier3", "")
-                        .replace(".tier4", "")
-                    )
-                config_files.add(name)
-
-    # Check tier directories
-    for install_tier in tiers_to_install:
-        tier_dir = template_dir / install_tier
-        if not tier_dir.exists():
-            continue
-        for file_path in tier_dir.rglob("*"):
-            if file_path.is_dir():
-                continue
-            relative_path = file_path.relative_to(tier_dir)
-            if any(part in SKIP_DIRECTORIES for part in relative_path.parts):
-                continue
-            if _is_config_file(file_path):
-                name = file_path.name
-                if name.endswith(".template"):
-                    name = (
-                        name.replace(".template", "")
-                        .replace(".tier1", "")
-                        .replace(".tier2", "")
-                        .replace(".tier3", "")
-                        .replace(".tier4", "")
-                    )
-                config_files.add(name)
-
-    return sorted(config_files)
+    # Entries are unique per output name, so no further de-duplication is needed
+    return sorted(
+        output_name
+        for output_name, file_path, _ in _enumerate_tier_files(template_dir, tier)
+        if _is_config_file(file_path)
+    )
 
 
 def _get_language_gitignore_entries(project_info: ProjectInfo) -> list[str]:
@@ -922,7 +959,9 @@ def run_adoption(
     output.info(f"   Confidence: {project_info.confidence:.0%}")
     output.info("")
 
-    logger.info(f"Project detection summary:\n{get_project_summary(project_info)}\n")
+    # Only build the summary when it will actually be logged
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Project detection summary:\n{get_project_summary(project_info)}\n")
 
     # =========================================================================
     # STEP 2: Check for existing Solokit installation
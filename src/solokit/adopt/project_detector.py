@@ -9,6 +9,9 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+from collections import Counter
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -30,9 +33,12 @@ class ProjectLanguage(str, Enum):
         return self.value
 
     @classmethod
-    def values(cls) -> list[str]:
-        """Return list of all valid language values."""
-        return [item.value for item in cls]
+    def values(cls) -> tuple[str, ...]:
+        """Return all valid language values."""
+        return _LANGUAGE_VALUES
+
+
+_LANGUAGE_VALUES: tuple[str, ...] = tuple(item.value for item in ProjectLanguage)
 
 
 class ProjectFramework(str, Enum):
@@ -62,9 +68,12 @@ class ProjectFramework(str, Enum):
         return self.value
 
     @classmethod
-    def values(cls) -> list[str]:
-        """Return list of all valid framework values."""
-        return [item.value for item in cls]
+    def values(cls) -> tuple[str, ...]:
+        """Return all valid framework values."""
+        return _FRAMEWORK_VALUES
+
+
+_FRAMEWORK_VALUES: tuple[str, ...] = tuple(item.value for item in ProjectFramework)
 
 
 class PackageManager(str, Enum):
@@ -88,12 +97,15 @@ class PackageManager(str, Enum):
         return self.value
 
     @classmethod
-    def values(cls) -> list[str]:
-        """Return list of all valid package manager values."""
-        return [item.value for item in cls]
+    def values(cls) -> tuple[str, ...]:
+        """Return all valid package manager values."""
+        return _PACKAGE_MANAGER_VALUES
 
 
-@dataclass
+_PACKAGE_MANAGER_VALUES: tuple[str, ...] = tuple(item.value for item in PackageManager)
+
+
+@dataclass(slots=True)
 class ExistingTooling:
     """Existing development tooling detected in the project."""
 
@@ -108,7 +120,7 @@ class ExistingTooling:
     ci_provider: str | None = None  # github, gitlab, circleci
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectInfo:
     """Complete project information from detection."""
 
@@ -148,20 +160,23 @@ def detect_project_type(project_root: Path | None = None) -> ProjectInfo:
 
     info = ProjectInfo()
 
+    # List the project root once; detection steps answer existence checks from it
+    root_names = _list_root_names(project_root)
+
     # Step 1: Detect from manifest files
-    _detect_from_manifests(project_root, info)
+    _detect_from_manifests(project_root, info, root_names)
 
     # Step 2: Detect framework
-    _detect_framework(project_root, info)
+    _detect_framework(project_root, info, root_names)
 
     # Step 3: Detect package manager
-    _detect_package_manager(project_root, info)
+    _detect_package_manager(project_root, info, root_names)
 
     # Step 4: Detect existing tooling
-    _detect_existing_tooling(project_root, info)
+    _detect_existing_tooling(project_root, info, root_names)
 
     # Step 5: Check documentation files
-    _detect_documentation(project_root, info)
+    _detect_documentation(project_root, info, root_names)
 
     # Step 6: Fallback to file extension counting if still unknown
     if info.language == ProjectLanguage.UNKNOWN:
@@ -178,14 +193,32 @@ def detect_project_type(project_root: Path | None = None) -> ProjectInfo:
     return info
 
 
-def _detect_from_manifests(project_root: Path, info: ProjectInfo) -> None:
+def _list_root_names(project_root: Path) -> frozenset[str]:
+    """
+    List entry names in the project root, or an empty set if it cannot be read.
+
+    Membership checks against this set are exact-case. Manifests, lock files and
+    tool configs are then opened by those exact names, which is also how the
+    owning tools look them up. Documentation checks lowercase the names first.
+    """
+    try:
+        with os.scandir(project_root) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError as e:
+        logger.debug(f"Could not list project root: {e}")
+        return frozenset()
+
+
+def _detect_from_manifests(
+    project_root: Path, info: ProjectInfo, root_names: frozenset[str]
+) -> None:
     """Detect language from manifest files (highest confidence)."""
     has_node = False
     has_python = False
 
     # Node.js detection
     package_json = project_root / "package.json"
-    if package_json.exists():
+    if "package.json" in root_names:
         has_node = True
         info.detection_notes.append("Found package.json")
 
@@ -204,7 +237,7 @@ def _detect_from_manifests(project_root: Path, info: ProjectInfo) -> None:
             logger.debug(f"Could not parse package.json: {e}")
 
     # TypeScript config also indicates TypeScript
-    if (project_root / "tsconfig.json").exists():
+    if "tsconfig.json" in root_names:
         has_node = True
         info.has_typescript = True
         info.detection_notes.append("Found tsconfig.json")
@@ -220,7 +253,7 @@ def _detect_from_manifests(project_root: Path, info: ProjectInfo) -> None:
     ]
 
     for manifest in python_manifests:
-        if (project_root / manifest).exists():
+        if manifest in root_names:
             has_python = True
             info.detection_notes.append(f"Found {manifest}")
             break
@@ -236,7 +269,7 @@ def _detect_from_manifests(project_root: Path, info: ProjectInfo) -> None:
         info.language = ProjectLanguage.PYTHON
 
 
-def _detect_framework(project_root: Path, info: ProjectInfo) -> None:
+def _detect_framework(project_root: Path, info: ProjectInfo, root_names: frozenset[str]) -> None:
     """Detect specific framework from config files and dependencies."""
     # Node.js / TypeScript frameworks
     if info.language in (
@@ -244,35 +277,37 @@ def _detect_framework(project_root: Path, info: ProjectInfo) -> None:
         ProjectLanguage.TYPESCRIPT,
         ProjectLanguage.FULLSTACK,
     ):
-        _detect_node_framework(project_root, info)
+        _detect_node_framework(project_root, info, root_names)
 
     # Python frameworks
     if info.language in (ProjectLanguage.PYTHON, ProjectLanguage.FULLSTACK):
-        _detect_python_framework(project_root, info)
+        _detect_python_framework(project_root, info, root_names)
 
 
-def _detect_node_framework(project_root: Path, info: ProjectInfo) -> None:
+def _detect_node_framework(
+    project_root: Path, info: ProjectInfo, root_names: frozenset[str]
+) -> None:
     """Detect Node.js/TypeScript framework."""
     # Next.js
-    if (project_root / "next.config.js").exists() or (project_root / "next.config.ts").exists():
+    if "next.config.js" in root_names or "next.config.ts" in root_names:
         info.framework = ProjectFramework.NEXTJS
         info.detection_notes.append("Next.js detected (next.config)")
         return
 
-    if (project_root / "next.config.mjs").exists():
+    if "next.config.mjs" in root_names:
         info.framework = ProjectFramework.NEXTJS
         info.detection_notes.append("Next.js detected (next.config.mjs)")
         return
 
     # Nuxt.js
-    if (project_root / "nuxt.config.js").exists() or (project_root / "nuxt.config.ts").exists():
+    if "nuxt.config.js" in root_names or "nuxt.config.ts" in root_names:
         info.framework = ProjectFramework.NUXT
         info.detection_notes.append("Nuxt.js detected (nuxt.config)")
         return
 
     # Check package.json for framework dependencies
     package_json = project_root / "package.json"
-    if package_json.exists():
+    if "package.json" in root_names:
         try:
             with open(package_json) as f:
                 pkg_data = json.load(f)
@@ -318,17 +353,19 @@ def _detect_node_framework(project_root: Path, info: ProjectInfo) -> None:
             pass
 
 
-def _detect_python_framework(project_root: Path, info: ProjectInfo) -> None:
+def _detect_python_framework(
+    project_root: Path, info: ProjectInfo, root_names: frozenset[str]
+) -> None:
     """Detect Python framework."""
     # Django - look for manage.py and settings
-    if (project_root / "manage.py").exists():
+    if "manage.py" in root_names:
         info.framework = ProjectFramework.DJANGO
         info.detection_notes.append("Django detected (manage.py)")
         return
 
     # Check pyproject.toml for dependencies
     pyproject = project_root / "pyproject.toml"
-    if pyproject.exists():
+    if "pyproject.toml" in root_names:
         try:
             content = pyproject.read_text()
 
@@ -357,7 +394,7 @@ def _detect_python_framework(project_root: Path, info: ProjectInfo) -> None:
 
     # Check requirements.txt
     requirements = project_root / "requirements.txt"
-    if requirements.exists():
+    if "requirements.txt" in root_names:
         try:
             content = requirements.read_text().lower()
 
@@ -380,7 +417,9 @@ def _detect_python_framework(project_root: Path, info: ProjectInfo) -> None:
             pass
 
 
-def _detect_package_manager(project_root: Path, info: ProjectInfo) -> None:
+def _detect_package_manager(
+    project_root: Path, info: ProjectInfo, root_names: frozenset[str]
+) -> None:
     """Detect package manager from lock files."""
     # Node.js package managers
     if info.language in (
@@ -388,16 +427,16 @@ def _detect_package_manager(project_root: Path, info: ProjectInfo) -> None:
         ProjectLanguage.TYPESCRIPT,
         ProjectLanguage.FULLSTACK,
     ):
-        if (project_root / "pnpm-lock.yaml").exists():
+        if "pnpm-lock.yaml" in root_names:
             pm = PackageManager.PNPM
             info.detection_notes.append("pnpm detected (pnpm-lock.yaml)")
-        elif (project_root / "yarn.lock").exists():
+        elif "yarn.lock" in root_names:
             pm = PackageManager.YARN
             info.detection_notes.append("yarn detected (yarn.lock)")
-        elif (project_root / "package-lock.json").exists():
+        elif "package-lock.json" in root_names:
             pm = PackageManager.NPM
             info.detection_notes.append("npm detected (package-lock.json)")
-        elif (project_root / "package.json").exists():
+        elif "package.json" in root_names:
             pm = PackageManager.NPM  # Default to npm if package.json exists
             info.detection_notes.append("npm assumed (package.json exists)")
         else:
@@ -410,22 +449,22 @@ def _detect_package_manager(project_root: Path, info: ProjectInfo) -> None:
 
     # Python package managers
     if info.language in (ProjectLanguage.PYTHON, ProjectLanguage.FULLSTACK):
-        if (project_root / "uv.lock").exists():
+        if "uv.lock" in root_names:
             pm = PackageManager.UV
             info.detection_notes.append("uv detected (uv.lock)")
-        elif (project_root / "poetry.lock").exists():
+        elif "poetry.lock" in root_names:
             pm = PackageManager.POETRY
             info.detection_notes.append("poetry detected (poetry.lock)")
-        elif (project_root / "Pipfile.lock").exists():
+        elif "Pipfile.lock" in root_names:
             pm = PackageManager.PIPENV
             info.detection_notes.append("pipenv detected (Pipfile.lock)")
-        elif (project_root / "Pipfile").exists():
+        elif "Pipfile" in root_names:
             pm = PackageManager.PIPENV
             info.detection_notes.append("pipenv detected (Pipfile)")
-        elif (project_root / "requirements.txt").exists():
+        elif "requirements.txt" in root_names:
             pm = PackageManager.PIP
             info.detection_notes.append("pip detected (requirements.txt)")
-        elif (project_root / "pyproject.toml").exists():
+        elif "pyproject.toml" in root_names:
             # Could be poetry, pip, or uv - check content
             pm = _detect_python_pm_from_pyproject(project_root)
             info.detection_notes.append(f"{pm.value} detected (pyproject.toml)")
@@ -441,9 +480,6 @@ def _detect_package_manager(project_root: Path, info: ProjectInfo) -> None:
 def _detect_python_pm_from_pyproject(project_root: Path) -> PackageManager:
     """Detect Python package manager from pyproject.toml content."""
     pyproject = project_root / "pyproject.toml"
-    if not pyproject.exists():
-        return PackageManager.UNKNOWN
-
     try:
         content = pyproject.read_text()
 
@@ -462,7 +498,9 @@ def _detect_python_pm_from_pyproject(project_root: Path) -> PackageManager:
         return PackageManager.UNKNOWN
 
 
-def _detect_existing_tooling(project_root: Path, info: ProjectInfo) -> None:
+def _detect_existing_tooling(
+    project_root: Path, info: ProjectInfo, root_names: frozenset[str]
+) -> None:
     """Detect existing linters, formatters, and other tooling."""
     tooling = ExistingTooling()
 
@@ -477,14 +515,14 @@ def _detect_existing_tooling(project_root: Path, info: ProjectInfo) -> None:
         "eslint.config.mjs",
     ]
     for config in eslint_configs:
-        if (project_root / config).exists():
+        if config in root_names:
             tooling.linter = "eslint"
             info.detection_notes.append(f"ESLint detected ({config})")
             break
 
     # Check for ruff in pyproject.toml
     pyproject = project_root / "pyproject.toml"
-    if pyproject.exists():
+    if "pyproject.toml" in root_names:
         try:
             content = pyproject.read_text()
             if "[tool.ruff]" in content:
@@ -493,20 +531,20 @@ def _detect_existing_tooling(project_root: Path, info: ProjectInfo) -> None:
         except OSError:
             pass
 
-    if (project_root / "ruff.toml").exists():
+    if "ruff.toml" in root_names:
         tooling.linter = "ruff" if tooling.linter is None else tooling.linter
         info.detection_notes.append("Ruff detected (ruff.toml)")
 
     # Formatters
     prettier_configs = [".prettierrc", ".prettierrc.js", ".prettierrc.json", "prettier.config.js"]
     for config in prettier_configs:
-        if (project_root / config).exists():
+        if config in root_names:
             tooling.formatter = "prettier"
             info.detection_notes.append(f"Prettier detected ({config})")
             break
 
     # Black formatter (Python)
-    if pyproject.exists():
+    if "pyproject.toml" in root_names:
         try:
             content = pyproject.read_text()
             if "[tool.black]" in content:
@@ -516,10 +554,10 @@ def _detect_existing_tooling(project_root: Path, info: ProjectInfo) -> None:
             pass
 
     # Type checkers
-    if (project_root / "tsconfig.json").exists():
+    if "tsconfig.json" in root_names:
         tooling.type_checker = "typescript"
 
-    if pyproject.exists():
+    if "pyproject.toml" in root_names:
         try:
             content = pyproject.read_text()
             if "[tool.mypy]" in content:
@@ -530,28 +568,26 @@ def _detect_existing_tooling(project_root: Path, info: ProjectInfo) -> None:
         except OSError:
             pass
 
-    if (project_root / "mypy.ini").exists():
+    if "mypy.ini" in root_names:
         tooling.type_checker = "mypy" if tooling.type_checker is None else tooling.type_checker
         info.detection_notes.append("Mypy detected (mypy.ini)")
 
     # Test frameworks
     test_dirs = ["tests", "__tests__", "test", "spec"]
     for test_dir in test_dirs:
-        if (project_root / test_dir).exists():
+        if test_dir in root_names:
             tooling.test_directory = test_dir
             info.detection_notes.append(f"Test directory detected: {test_dir}/")
             break
 
     # Detect specific test framework
-    if (project_root / "jest.config.js").exists() or (project_root / "jest.config.ts").exists():
+    if "jest.config.js" in root_names or "jest.config.ts" in root_names:
         tooling.test_framework = "jest"
         info.detection_notes.append("Jest detected")
-    elif (project_root / "vitest.config.ts").exists() or (
-        project_root / "vitest.config.js"
-    ).exists():
+    elif "vitest.config.ts" in root_names or "vitest.config.js" in root_names:
         tooling.test_framework = "vitest"
         info.detection_notes.append("Vitest detected")
-    elif pyproject.exists():
+    elif "pyproject.toml" in root_names:
         try:
             content = pyproject.read_text()
             if "[tool.pytest" in content:
@@ -560,35 +596,35 @@ def _detect_existing_tooling(project_root: Path, info: ProjectInfo) -> None:
         except OSError:
             pass
 
-    if (project_root / "pytest.ini").exists():
+    if "pytest.ini" in root_names:
         tooling.test_framework = "pytest"
         info.detection_notes.append("Pytest detected (pytest.ini)")
 
-    if (project_root / "conftest.py").exists():
+    if "conftest.py" in root_names:
         tooling.test_framework = (
             "pytest" if tooling.test_framework is None else tooling.test_framework
         )
         info.detection_notes.append("Pytest detected (conftest.py)")
 
     # Git hooks
-    if (project_root / ".pre-commit-config.yaml").exists():
+    if ".pre-commit-config.yaml" in root_names:
         tooling.has_pre_commit = True
         info.detection_notes.append("pre-commit detected")
 
-    if (project_root / ".husky").exists():
+    if ".husky" in root_names:
         tooling.has_husky = True
         info.detection_notes.append("Husky detected")
 
     # CI/CD
-    if (project_root / ".github" / "workflows").exists():
+    if ".github" in root_names and (project_root / ".github" / "workflows").exists():
         tooling.has_ci = True
         tooling.ci_provider = "github"
         info.detection_notes.append("GitHub Actions detected")
-    elif (project_root / ".gitlab-ci.yml").exists():
+    elif ".gitlab-ci.yml" in root_names:
         tooling.has_ci = True
         tooling.ci_provider = "gitlab"
         info.detection_notes.append("GitLab CI detected")
-    elif (project_root / ".circleci").exists():
+    elif ".circleci" in root_names:
         tooling.has_ci = True
         tooling.ci_provider = "circleci"
         info.detection_notes.append("CircleCI detected")
@@ -596,43 +632,51 @@ def _detect_existing_tooling(project_root: Path, info: ProjectInfo) -> None:
     info.tooling = tooling
 
 
-def _detect_documentation(project_root: Path, info: ProjectInfo) -> None:
+def _detect_documentation(
+    project_root: Path, info: ProjectInfo, root_names: frozenset[str]
+) -> None:
     """Detect existing documentation files."""
-    # Check for README (case-insensitive)
-    readme_patterns = ["README.md", "readme.md", "Readme.md", "README.MD"]
-    for pattern in readme_patterns:
-        if (project_root / pattern).exists():
-            info.has_readme = True
-            break
+    # Documentation names are matched case-insensitively on every platform,
+    # so ReadMe.md or claude.md count even on case-sensitive filesystems
+    lower_names = {name.lower() for name in root_names}
+    info.has_readme = "readme.md" in lower_names
+    info.has_claude_md = "claude.md" in lower_names
+    info.has_architecture_md = "architecture.md" in lower_names
+
+
+# Directories never counted during extension-based detection
+_EXTENSION_SCAN_SKIP_DIRS = frozenset({"node_modules", "venv", "__pycache__", "dist", "build"})
 
-    info.has_claude_md = (project_root / "CLAUDE.md").exists()
-    info.has_architecture_md = (project_root / "ARCHITECTURE.md").exists()
+
+def _log_scan_error(error: OSError) -> None:
+    """Log a directory that os.walk could not list during extension scanning."""
+    logger.debug(f"Error scanning files: {error}")
+
+
+def _iter_source_filenames(project_root: Path) -> Iterator[str]:
+    """
+    Yield names of non-hidden files under a project, skipping vendored directories.
+
+    Hidden and skipped directories are pruned before descending into them;
+    unreadable directories are logged at debug level and skipped.
+    """
+    for _, dirnames, filenames in os.walk(project_root, onerror=_log_scan_error):
+        dirnames[:] = [
+            name
+            for name in dirnames
+            if not name.startswith(".") and name not in _EXTENSION_SCAN_SKIP_DIRS
+        ]
+        for filename in filenames:
+            if not filename.startswith("."):
+                yield filename
 
 
 def _detect_from_extensions(project_root: Path, info: ProjectInfo) -> None:
     """Fallback detection based on file extension counts."""
-    extension_counts: dict[str, int] = {}
-
-    # Count files by extension (limit depth to avoid huge repos)
-    try:
-        for path in project_root.rglob("*"):
-            # Skip hidden dirs, node_modules, venv, etc.
-            parts = path.parts
-            if any(
-                p.startswith(".")
-                or p in ("node_modules", "venv", ".venv", "__pycache__", "dist", "build")
-                for p in parts
-            ):
-                continue
-
-            if path.is_file():
-                ext = path.suffix.lower()
-                if ext:
-                    extension_counts[ext] = extension_counts.get(ext, 0) + 1
-
-    except (PermissionError, OSError) as e:
-        logger.debug(f"Error scanning files: {e}")
-        return
+    # Count files by extension in one C-level tally over a generator
+    extension_counts = Counter(
+        os.path.splitext(filename)[1].lower() for filename in _iter_source_filenames(project_root)
+    )
 
     # Analyze counts
     python_exts = extension_counts.get(".py", 0)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Configuration validation using JSON schema."""
 
+import functools
 import json
 import logging
 from pathlib import Path
@@ -83,8 +84,10 @@ def validate_config(config_path: Path, schema_path: Path) -> dict[str, Any]:
         return config_dict
 
     try:
-        with open(schema_path) as f:
-            schema = json.load(f)
+        schema_stat = schema_path.stat()
+        validator = _compile_schema(
+            str(schema_path.resolve()), schema_stat.st_mtime_ns, schema_stat.st_size
+        )
     except json.JSONDecodeError as e:
         raise ConfigurationError(
             message=f"Invalid JSON in schema file: {schema_path}",
@@ -93,15 +96,6 @@ def validate_config(config_path: Path, schema_path: Path) -> dict[str, Any]:
             remediation="Fix JSON syntax errors in schema file",
             cause=e,
         ) from e
-
-    # Validate
-    try:
-        jsonschema.validate(instance=config, schema=schema)
-        validated_config: dict[str, Any] = config
-        return validated_config
-    except jsonschema.ValidationError as e:
-        error_msg = _format_validation_error(e)
-        raise ConfigValidationError(config_path=str(config_path), errors=[error_msg]) from e
     except jsonschema.SchemaError as e:
         raise ConfigurationError(
             message=f"Invalid schema structure: {schema_path}",
@@ -111,6 +105,46 @@ def validate_config(config_path: Path, schema_path: Path) -> dict[str, Any]:
             cause=e,
         ) from e
 
+    # Validate (same error selection as jsonschema.validate)
+    error = jsonschema.exceptions.best_match(validator.iter_errors(config))
+    if error is not None:
+        error_msg = _format_validation_error(error)
+        raise ConfigValidationError(config_path=str(config_path), errors=[error_msg]) from error
+
+    validated_config: dict[str, Any] = config
+    return validated_config
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_schema(schema_path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Load a schema file and build a checked validator for it.
+
+    Results are cached per path, modification time and size, so repeated
+    validations against an unchanged schema skip reading, parsing and
+    checking it again. Editing the schema changes the key and reloads it.
+
+    Args:
+        schema_path: Resolved path to the schema file
+        mtime_ns: Schema file modification time in nanoseconds
+        size: Schema file size in bytes
+
+    Returns:
+        jsonschema validator instance for the schema
+
+    Raises:
+        json.JSONDecodeError: If the schema file is not valid JSON
+        jsonschema.SchemaError: If the schema structure is invalid
+    """
+    import jsonschema
+
+    with open(schema_path) as f:
+        schema = json.load(f)
+
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
 
 def _format_validation_error(error: Any) -> str:
     """Format validation error for user-friendly display."""
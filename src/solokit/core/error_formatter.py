@@ -16,6 +16,7 @@ Usage:
 """
 
 import sys
+from itertools import islice
 from typing import Any
 
 from solokit.core.exceptions import ErrorCategory, SolokitError
@@ -24,6 +25,20 @@ from solokit.core.exceptions import ErrorCategory, SolokitError
 class ErrorFormatter:
     """Format exceptions for CLI output"""
 
+    # Emoji symbol per error category, built once at import
+    _SYMBOLS: dict[ErrorCategory, str] = {
+        ErrorCategory.VALIDATION: "⚠️",
+        ErrorCategory.NOT_FOUND: "🔍",
+        ErrorCategory.CONFIGURATION: "⚙️",
+        ErrorCategory.SYSTEM: "💥",
+        ErrorCategory.GIT: "🔀",
+        ErrorCategory.DEPENDENCY: "🔗",
+        ErrorCategory.SECURITY: "🔒",
+        ErrorCategory.TIMEOUT: "⏱️",
+        ErrorCategory.ALREADY_EXISTS: "📋",
+        ErrorCategory.PERMISSION: "🔐",
+    }
+
     @staticmethod
     def format_error(error: Exception, verbose: bool = False) -> str:
         """
@@ -60,22 +75,7 @@ class ErrorFormatter:
         # Context (if verbose or critical info)
         if verbose and error.context:
             lines.append("\nContext:")
-            for key, value in error.context.items():
-                # Format lists and dicts nicely
-                if isinstance(value, list):
-                    lines.append(f"  {key}:")
-                    for item in value[:10]:  # Limit to 10 items
-                        lines.append(f"    - {item}")
-                    if len(value) > 10:
-                        lines.append(f"    ... and {len(value) - 10} more")
-                elif isinstance(value, dict):
-                    lines.append(f"  {key}:")
-                    for k, v in list(value.items())[:10]:
-                        lines.append(f"    {k}: {v}")
-                    if len(value) > 10:
-                        lines.append(f"    ... and {len(value) - 10} more items")
-                else:
-                    lines.append(f"  {key}: {value}")
+            ErrorFormatter._format_context(error.context, lines)
 
         # Remediation (always show if available)
         if error.remediation:
@@ -92,6 +92,25 @@ class ErrorFormatter:
 
         return "\n".join(lines)
 
+    @staticmethod
+    def _format_context(context: dict[str, Any], lines: list[str]) -> None:
+        """Append context entries to lines, showing at most 10 items per list or dict"""
+        for key, value in context.items():
+            # Format lists and dicts nicely
+            if isinstance(value, list):
+                lines.append(f"  {key}:")
+                lines.extend(f"    - {item}" for item in value[:10])
+                if len(value) > 10:
+                    lines.append(f"    ... and {len(value) - 10} more")
+            elif isinstance(value, dict):
+                lines.append(f"  {key}:")
+                # islice avoids copying every item of a large dict to show 10
+                lines.extend(f"    {k}: {v}" for k, v in islice(value.items(), 10))
+                if len(value) > 10:
+                    lines.append(f"    ... and {len(value) - 10} more items")
+            else:
+                lines.append(f"  {key}: {value}")
+
     @staticmethod
     def _format_generic_error(error: Exception, verbose: bool) -> str:
         """Format generic exception"""
@@ -105,19 +124,7 @@ class ErrorFormatter:
     @staticmethod
     def _get_error_symbol(category: ErrorCategory) -> str:
         """Get emoji symbol for error category"""
-        symbols = {
-            ErrorCategory.VALIDATION: "⚠️",
-            ErrorCategory.NOT_FOUND: "🔍",
-            ErrorCategory.CONFIGURATION: "⚙️",
-            ErrorCategory.SYSTEM: "💥",
-            ErrorCategory.GIT: "🔀",
-            ErrorCategory.DEPENDENCY: "🔗",
-            ErrorCategory.SECURITY: "🔒",
-            ErrorCategory.TIMEOUT: "⏱️",
-            ErrorCategory.ALREADY_EXISTS: "📋",
-            ErrorCategory.PERMISSION: "🔐",
-        }
-        return symbols.get(category, "❌")
+        return ErrorFormatter._SYMBOLS.get(category, "❌")
 
     @staticmethod
     def print_error(error: Exception, verbose: bool = False, file: Any = None) -> None:
@@ -142,14 +149,16 @@ class ErrorFormatter:
 
         formatted = ErrorFormatter.format_error(error, verbose)
         logger = logging.getLogger(__name__)
+        # One write per stream instead of print()'s separate text and newline writes
+        message = f"{formatted}\n"
 
         try:
-            print(formatted, file=file)
+            file.write(message)
         except (ValueError, OSError) as e:
             # Handle closed file (e.g., in tests with capsys)
             logger.warning(f"Could not write to stderr: {e}, trying stdout")
             try:
-                print(formatted, file=sys.stdout)
+                sys.stdout.write(message)
             except (ValueError, OSError) as e2:
                 # Both are closed - log the error instead of silently suppressing
                 logger.error(f"Could not write error to stderr or stdout: {e2}")
@@ -197,14 +206,8 @@ def format_validation_errors(errors: list[str], header: str | None = None) -> st
           1. Missing field 'name'
           2. Invalid value for 'age'
     """
-    lines = []
-
-    if header:
-        lines.append(f"⚠️ {header}")
-        lines.append("")
-
-    for i, error in enumerate(errors, 1):
-        lines.append(f"  {i}. {error}")
+    lines = [f"⚠️ {header}", ""] if header else []
+    lines.extend(f"  {i}. {error}" for i, error in enumerate(errors, 1))
 
     return "\n".join(lines)
 
@@ -17,7 +17,6 @@ from __future__ import annotations
 
 import functools
 import logging
-import subprocess
 import time
 from collections.abc import Callable
 from typing import Any, Literal, TypeVar
@@ -31,16 +30,16 @@ T = TypeVar("T")
 
 
 def with_timeout(
-    seconds: int, operation_name: str
+    seconds: float, operation_name: str
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Decorator to add timeout to function execution.
 
-    Note: This uses signal.alarm which only works on Unix systems.
+    Note: This uses signal.setitimer which only works on Unix systems.
     On Windows, the timeout is not enforced but the function still runs.
 
     Args:
-        seconds: Timeout in seconds
+        seconds: Timeout in seconds (fractions allowed)
         operation_name: Name of operation for error message
 
     Returns:
@@ -66,12 +65,12 @@ def with_timeout(
 
                 # Set up timeout signal (Unix only)
                 old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(seconds)
+                signal.setitimer(signal.ITIMER_REAL, seconds)
 
                 try:
                     return func(*args, **kwargs)
                 finally:
-                    signal.alarm(0)
+                    signal.setitimer(signal.ITIMER_REAL, 0)
                     signal.signal(signal.SIGALRM, old_handler)
             except AttributeError:
                 # Windows doesn't have SIGALRM, just run without timeout
@@ -107,10 +106,16 @@ def with_retry(
         ...     return json.load(open(path))
     """
 
+    # The backoff schedule is fixed by the arguments, so compute it once
+    delays: list[float] = []
+    delay = delay_seconds
+    for _ in range(max_attempts - 1):
+        delays.append(delay)
+        delay *= backoff_multiplier
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            delay = delay_seconds
             last_exception = None
 
             for attempt in range(1, max_attempts + 1):
@@ -119,12 +124,12 @@ def with_retry(
                 except exceptions as e:
                     last_exception = e
                     if attempt < max_attempts:
+                        retry_delay = delays[attempt - 1]
                         logger.warning(
                             f"Attempt {attempt}/{max_attempts} failed for {func.__name__}: {e}. "
-                            f"Retrying in {delay}s..."
+                            f"Retrying in {retry_delay}s..."
                         )
-                        time.sleep(delay)
-                        delay *= backoff_multiplier
+                        time.sleep(retry_delay)
                     else:
                         logger.error(f"All {max_attempts} attempts failed for {func.__name__}")
 
@@ -159,10 +164,11 @@ def log_errors(
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        # Resolve the logger once per decorated function, not on every call
+        log = logger_instance or logging.getLogger(func.__module__)
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            log = logger_instance or logging.getLogger(func.__module__)
-
             try:
                 return func(*args, **kwargs)
             except SolokitError as e:
@@ -172,18 +178,14 @@ def log_errors(
                 # User input errors (ValidationError, NotFoundError) should be DEBUG level
                 # System/integration errors should be ERROR level
                 if isinstance(e, (ValidationError, NotFoundError)):
-                    log.debug(
-                        f"{func.__name__} failed: {e.message}",
-                        extra={
-                            "error_code": e.code.value,
-                            "error_category": e.category.value,
-                            "context": e.context,
-                            "function": func.__name__,
-                        },
-                    )
+                    level = logging.DEBUG
                 else:
-                    # Log system/integration errors at ERROR level
-                    log.error(
+                    level = logging.ERROR
+
+                # Skip building the message and extra data when nothing would emit it
+                if log.isEnabledFor(level):
+                    log.log(
+                        level,
                         f"{func.__name__} failed: {e.message}",
                         extra={
                             "error_code": e.code.value,
@@ -219,6 +221,9 @@ def convert_subprocess_errors(func: Callable[..., T]) -> Callable[..., T]:
         ...     return result.stdout
     """
 
+    # Imported here so modules that only need the other handlers skip loading subprocess
+    import subprocess
+
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> T:
         try:
@@ -136,6 +136,21 @@ class ErrorCode(Enum):
     LOAD_TEST_FAILED = 13004
 
 
+# CLI exit code per error category, built once at import
+_EXIT_CODES: dict[ErrorCategory, int] = {
+    ErrorCategory.VALIDATION: 2,
+    ErrorCategory.NOT_FOUND: 3,
+    ErrorCategory.CONFIGURATION: 4,
+    ErrorCategory.SYSTEM: 5,
+    ErrorCategory.GIT: 6,
+    ErrorCategory.DEPENDENCY: 7,
+    ErrorCategory.SECURITY: 8,
+    ErrorCategory.TIMEOUT: 9,
+    ErrorCategory.ALREADY_EXISTS: 10,
+    ErrorCategory.PERMISSION: 11,
+}
+
+
 class SolokitError(Exception):
     """
     Base exception for all Solokit errors.
@@ -180,19 +195,7 @@ class SolokitError(Exception):
     @property
     def exit_code(self) -> int:
         """Get CLI exit code based on error category"""
-        exit_codes = {
-            ErrorCategory.VALIDATION: 2,
-            ErrorCategory.NOT_FOUND: 3,
-            ErrorCategory.CONFIGURATION: 4,
-            ErrorCategory.SYSTEM: 5,
-            ErrorCategory.GIT: 6,
-            ErrorCategory.DEPENDENCY: 7,
-            ErrorCategory.SECURITY: 8,
-            ErrorCategory.TIMEOUT: 9,
-            ErrorCategory.ALREADY_EXISTS: 10,
-            ErrorCategory.PERMISSION: 11,
-        }
-        return exit_codes.get(self.category, 1)
+        return _EXIT_CODES.get(self.category, 1)
 
     def __str__(self) -> str:
         """Format error for display"""
@@ -597,7 +600,9 @@ class TimeoutError(SystemError):
         ... )
     """
 
-    def __init__(self, operation: str, timeout_seconds: int, context: dict[str, Any] | None = None):
+    def __init__(
+        self, operation: str, timeout_seconds: float, context: dict[str, Any] | None = None
+    ):
         ctx = context or {}
         ctx.update({"operation": operation, "timeout_seconds": timeout_seconds})
         super().__init__(
@@ -17,6 +17,10 @@ from solokit.core.exceptions import FileOperationError, TemplateNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Matches {identifier} placeholders in template files
+_PLACEHOLDER_PATTERN = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+_PLACEHOLDER_BYTES_PATTERN = re.compile(rb"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
 
 def load_template_registry() -> dict[str, Any]:
     """
@@ -156,12 +160,41 @@ def replace_placeholders(content: str, replacements: dict[str, str]) -> str:
         replacements: Dictionary of placeholder -> value
 
     Returns:
-        Content with placeholders replaced
+        Content with placeholders replaced. Unknown placeholders and other
+        brace-delimited text are left untouched.
+    """
+    if not replacements:
+        return content
+
+    def _substitute(match: re.Match[str]) -> str:
+        return replacements.get(match.group(1), match.group(0))
+
+    return _PLACEHOLDER_PATTERN.sub(_substitute, content)
+
+
+def replace_placeholders_in_bytes(content: bytes, replacements: dict[str, str]) -> bytes:
+    """
+    Replace placeholders in raw template bytes.
+
+    Placeholders are ASCII, so the template can be substituted without
+    decoding it; only the replacement values are encoded (as UTF-8).
+
+    Args:
+        content: Template bytes with placeholders like {project_name}
+        replacements: Dictionary of placeholder -> value
+
+    Returns:
+        Bytes with placeholders replaced
     """
-    result = content
-    for placeholder, value in replacements.items():
-        result = result.replace(f"{{{placeholder}}}", value)
-    return result
+    if not replacements:
+        return content
+
+    encoded = {key.encode("utf-8"): value.encode("utf-8") for key, value in replacements.items()}
+
+    def _substitute(match: re.Match[bytes]) -> bytes:
+        return encoded.get(match.group(1), match.group(0))
+
+    return _PLACEHOLDER_BYTES_PATTERN.sub(_substitute, content)
 
 
 def install_base_template(
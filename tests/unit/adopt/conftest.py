@@ -9,6 +9,16 @@ from unittest.mock import Mock
 
 import pytest
 
+from solokit.adopt.orchestrator import _enumerate_tier_files
+
+
+@pytest.fixture(autouse=True)
+def clear_tier_file_cache():
+    """Clear the cached template enumeration so each test sees its own template tree."""
+    _enumerate_tier_files.cache_clear()
+    yield
+    _enumerate_tier_files.cache_clear()
+
 
 @pytest.fixture
 def temp_project(tmp_path):
@@ -11,6 +11,7 @@ import pytest
 
 from solokit.adopt.orchestrator import (
     _create_adoption_commit,
+    _enumerate_tier_files,
     _get_language_gitignore_entries,
     _get_template_id_for_language,
     _get_tier_order,
@@ -154,6 +155,12 @@ class TestIsConfigFile:
         result = _is_config_file(file_path)
         assert result is False
 
+    def test_accepts_plain_string_names(self):
+        """Test accepts bare filenames and string relative paths."""
+        assert _is_config_file("tsconfig.json") is True
+        assert _is_config_file("schema.prisma", "prisma/schema.prisma") is True
+        assert _is_config_file("index.ts", "app/index.ts") is False
+
 
 class TestInstallConfigFile:
     """Tests for _install_config_file function."""
@@ -179,6 +186,23 @@ class TestInstallConfigFile:
         assert output_path.exists()
         assert output_path.read_text() == '{"compilerOptions": {}}'
 
+    def test_copies_direct_config_file_without_decoding(self, tmp_path):
+        """Test direct config files are copied byte-for-byte without a text round-trip."""
+        # Arrange
+        src_path = tmp_path / "src" / "tsconfig.json"
+        src_path.parent.mkdir(parents=True)
+        src_path.write_bytes(b'{"a": "\xff"}\r\n')
+
+        project_root = tmp_path / "project"
+        relative_path = Path("tsconfig.json")
+
+        # Act
+        result = _install_config_file(src_path, project_root, relative_path, {})
+
+        # Assert
+        assert result == (True, "installed")
+        assert (project_root / "tsconfig.json").read_bytes() == b'{"a": "\xff"}\r\n'
+
     def test_processes_template_file(self, tmp_path):
         """Test processes template files with replacements."""
         # Arrange
@@ -418,6 +442,31 @@ class TestGetConfigFilesToInstall:
         assert "package.json" in result
         assert "package.json.tier1.template" not in result
 
+    @patch("solokit.init.template_installer.get_template_directory")
+    def test_preview_and_install_share_template_walk(self, mock_get_template, tmp_path):
+        """Test previewing then installing a tier enumerates the template once."""
+        # Arrange
+        template_dir = tmp_path / "template"
+        base_dir = template_dir / "base"
+        base_dir.mkdir(parents=True)
+        (base_dir / "tsconfig.json").write_text("{}")
+
+        mock_get_template.return_value = template_dir
+
+        project_root = tmp_path / "project"
+        project_root.mkdir()
+
+        # Act
+        preview = get_config_files_to_install("saas_t3", "tier-1-essential")
+        results = install_tier_configs("saas_t3", "tier-1-essential", project_root, 80)
+
+        # Assert
+        assert preview == ["tsconfig.json"]
+        assert results["installed"] == ["tsconfig.json"]
+        cache_info = _enumerate_tier_files.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+
     @patch("solokit.init.template_installer.get_template_directory")
     def test_returns_empty_list_on_error(self, mock_get_template):
         """Test returns empty list on error."""
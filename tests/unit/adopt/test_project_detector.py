@@ -9,6 +9,7 @@ Run tests:
 Target: 90%+ coverage
 """
 
+import logging
 from pathlib import Path
 from unittest.mock import patch
 
@@ -137,6 +138,16 @@ class TestDetectProjectType:
 
                 assert info.language == ProjectLanguage.UNKNOWN
 
+    def test_lists_project_root_once(self, project_with_tools):
+        """Test root-level existence checks are answered from a single directory listing."""
+        import os
+
+        with patch("solokit.adopt.project_detector.os.scandir", wraps=os.scandir) as mock_scandir:
+            info = detect_project_type(project_with_tools)
+
+        assert mock_scandir.call_count == 1
+        assert info.language != ProjectLanguage.UNKNOWN
+
     def test_confidence_calculation(self, project_with_tools):
         """Test confidence score calculation."""
         info = detect_project_type(project_with_tools)
@@ -811,6 +822,26 @@ class TestDocumentationDetection:
 
         assert info.has_readme is True
 
+    def test_readme_detection_mixed_case(self, tmp_path):
+        """Test ReadMe.md detection (mixed case)."""
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "ReadMe.md").write_text("# Project")
+
+        info = detect_project_type(project)
+
+        assert info.has_readme is True
+
+    def test_claude_md_detection_lowercase(self, tmp_path):
+        """Test claude.md detection (lowercase)."""
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "claude.md").write_text("# Claude Guidelines")
+
+        info = detect_project_type(project)
+
+        assert info.has_claude_md is True
+
     def test_claude_md_detection(self, tmp_path):
         """Test CLAUDE.md detection."""
         project = tmp_path / "project"
@@ -843,6 +874,15 @@ class TestDocumentationDetection:
 class TestFallbackExtensionDetection:
     """Tests for fallback file extension detection."""
 
+    def test_unreadable_directory_logged_and_skipped(self, tmp_path, caplog):
+        """Test directories os.walk cannot list are logged at debug level."""
+        caplog.set_level(logging.DEBUG, logger="solokit.adopt.project_detector")
+
+        info = detect_project_type(tmp_path / "missing")
+
+        assert info.language == ProjectLanguage.UNKNOWN
+        assert any("Error scanning files" in r.getMessage() for r in caplog.records)
+
     def test_python_from_extensions(self, tmp_path):
         """Test Python detection from .py file extensions."""
         project = tmp_path / "project"
@@ -1047,6 +1087,28 @@ class TestEnumClasses:
         assert "poetry" in values
         assert "uv" in values
 
+    def test_values_are_cached_tuples(self):
+        """Test values() returns the same immutable tuple on every call."""
+        for enum_cls in (ProjectLanguage, ProjectFramework, PackageManager):
+            values = enum_cls.values()
+
+            assert isinstance(values, tuple)
+            assert enum_cls.values() is values
+            assert values == tuple(item.value for item in enum_cls)
+
+
+class TestDataClasses:
+    """Tests for detection result dataclasses."""
+
+    def test_dataclasses_use_slots(self):
+        """Test ProjectInfo and ExistingTooling instances carry no __dict__."""
+        info = ProjectInfo(tooling=ExistingTooling(linter="ruff"))
+
+        assert not hasattr(info, "__dict__")
+        assert not hasattr(info.tooling, "__dict__")
+        assert info.tooling.linter == "ruff"
+        assert info.detection_notes == []
+
 
 class TestConfidenceCalculation:
     """Tests for confidence score calculation."""
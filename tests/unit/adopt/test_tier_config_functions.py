@@ -253,6 +253,37 @@ class TestInstallConfigFile:
         assert '"new": "content"' in existing.read_text()
         assert '"old": "content"' not in existing.read_text()
 
+    def test_skips_unchanged_previous_install(self, temp_project):
+        """Test that re-installing an untouched copy is skipped unless forced."""
+        src_file = temp_project / "src" / "config.json"
+        src_file.parent.mkdir()
+        src_file.write_text('{"new": "content"}')
+        dest = temp_project / "dest"
+
+        first = _install_config_file(src_file, dest, Path("config.json"), {})
+        second = _install_config_file(src_file, dest, Path("config.json"), {})
+        forced = _install_config_file(src_file, dest, Path("config.json"), {}, force=True)
+
+        assert first == (True, "installed")
+        assert second == (True, "skipped_exists")
+        assert forced == (True, "installed")
+
+    def test_reinstalls_edited_copy(self, temp_project):
+        """Test that an installed copy edited since is not treated as unchanged."""
+        src_file = temp_project / "src" / "config.json"
+        src_file.parent.mkdir()
+        src_file.write_text('{"a": 1}')
+        dest = temp_project / "dest"
+        _install_config_file(src_file, dest, Path("config.json"), {})
+
+        installed = dest / "config.json"
+        installed.write_text('{"a": 2, "b": 3}')
+
+        result = _install_config_file(src_file, dest, Path("config.json"), {})
+
+        assert result == (True, "installed")
+        assert installed.read_text() == '{"a": 1}'
+
 
 class TestInstallTierConfigs:
     """Tests for install_tier_configs() function."""
@@ -428,6 +459,51 @@ class TestInstallTierConfigs:
             assert "README.md" not in all_files
             assert "data.json" not in all_files
 
+    def test_installs_overridden_file_once(self, temp_project):
+        """Test that a file overridden by a later tier is installed once from its first source."""
+        with patch("solokit.init.template_installer.get_template_directory") as mock_get_template:
+            template_dir = temp_project / "template"
+            tier1 = template_dir / "tier-1-essential"
+            tier2 = template_dir / "tier-2-standard"
+            tier1.mkdir(parents=True)
+            tier2.mkdir(parents=True)
+
+            (tier1 / "eslint.config.mjs").write_text("// tier1")
+            (tier2 / "eslint.config.mjs").write_text("// tier2")
+
+            mock_get_template.return_value = template_dir
+
+            results = install_tier_configs("saas_t3", "tier-2-standard", temp_project / "dest", 80)
+
+            assert results["installed"] == ["eslint.config.mjs"]
+            assert (temp_project / "dest" / "eslint.config.mjs").read_text() == "// tier1"
+
+    @pytest.mark.parametrize("no_parallel", ["", "1"])
+    def test_parallel_and_sequential_install_match(self, temp_project, monkeypatch, no_parallel):
+        """Test results keep install order whether or not files are installed concurrently."""
+        monkeypatch.setenv("SOLOKIT_NO_PARALLEL", no_parallel)
+        with patch("solokit.init.template_installer.get_template_directory") as mock_get_template:
+            template_dir = temp_project / "template"
+            base_dir = template_dir / "base"
+            tier1 = template_dir / "tier-1-essential"
+            base_dir.mkdir(parents=True)
+            tier1.mkdir(parents=True)
+            (base_dir / "tsconfig.json").write_text("{}")
+            (tier1 / "eslint.config.mjs").write_text("export default {};")
+            (tier1 / "jest.config.ts").write_text("export default {};")
+
+            mock_get_template.return_value = template_dir
+
+            results = install_tier_configs("saas_t3", "tier-1-essential", temp_project / "dest", 80)
+
+            assert results["installed"][0] == "tsconfig.json"
+            assert sorted(results["installed"]) == [
+                "eslint.config.mjs",
+                "jest.config.ts",
+                "tsconfig.json",
+            ]
+            assert results["errors"] == []
+
     def test_handles_missing_template_directory(self, temp_project):
         """Test graceful handling when template directory doesn't exist."""
         with patch("solokit.init.template_installer.get_template_directory") as mock_get_template:
@@ -1,11 +1,12 @@
 """Unit tests for doctor command."""
 
+import os
 import subprocess
-import sys
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
 import pytest
 
+from solokit.commands import doctor as doc
 from solokit.commands.doctor import (
     DiagnosticCheck,
     check_config_valid,
@@ -20,42 +21,104 @@ from solokit.commands.doctor import (
     run_diagnostics,
 )
 
+# Stand-in for the CompletedProcess of `git --version`; the check only reads stdout
+_GIT_VERSION_RESULT = SimpleNamespace(stdout="git version 2.39.0\n")
+
+# Set SOLOKIT_FAST_TESTS to skip tests that only re-check the running interpreter
+FAST = bool(os.environ.get("SOLOKIT_FAST_TESTS"))
+
+
+@pytest.fixture(scope="module")
+def session_trees(tmp_path_factory):
+    """Build the read-only project layouts shared by the filesystem check tests.
+
+    Each layout is materialized once per module; tests ``monkeypatch.chdir`` into
+    one instead of recreating it. Tests that need other file contents use ``tmp_path``.
+    """
+    root = tmp_path_factory.mktemp("doctor_trees")
+    layouts = {
+        "empty": {},
+        "session_only": {},
+        "session_empty_config": {"config.json": "{}"},
+        "session_valid_config": {"config.json": '{"test": "data"}'},
+        "session_with_work_items": {"work_items.json": '[{"id": "WI-001", "title": "Test"}]'},
+    }
+
+    trees = {}
+    for name, files in layouts.items():
+        project = root / name
+        project.mkdir()
+        if name != "empty":
+            session_dir = project / ".session"
+            session_dir.mkdir()
+            for filename, content in files.items():
+                (session_dir / filename).write_text(content)
+        trees[name] = project
+    return trees
+
+
+@pytest.fixture(scope="module")
+def session_template(tmp_path_factory):
+    """Build one fully initialized project that tests mirror with hardlinks."""
+    project = tmp_path_factory.mktemp("doctor_template")
+    session_dir = project / ".session"
+    session_dir.mkdir()
+    (session_dir / "config.json").write_text('{"test": "data"}')
+    (session_dir / "work_items.json").write_text('[{"id": "WI-001", "title": "Test"}]')
+    return project
 
-def test_parse_version_standard():
-    """Test parsing standard version string."""
-    assert parse_version("3.11.7") == (3, 11, 7)
-    assert parse_version("2.45.0") == (2, 45, 0)
 
+def _mirror(dst, template):
+    """Hardlink the template's ``.session`` files into ``dst``; callers must not modify them."""
+    (dst / ".session").mkdir()
+    for source in (template / ".session").iterdir():
+        os.link(source, dst / ".session" / source.name)
 
-def test_parse_version_with_v_prefix():
-    """Test parsing version string with 'v' prefix."""
-    assert parse_version("v3.11.7") == (3, 11, 7)
-    assert parse_version("v2.45.0") == (2, 45, 0)
 
+@pytest.fixture
+def which_stub(monkeypatch):
+    """Return a helper that makes ``shutil.which`` find only the given tools."""
 
-def test_parse_version_without_patch():
-    """Test parsing version string without patch version."""
-    assert parse_version("3.11") == (3, 11, 0)
+    def install(*tools):
+        monkeypatch.setattr(
+            doc.shutil, "which", lambda name: f"/usr/bin/{name}" if name in tools else None
+        )
 
+    return install
 
-def test_parse_version_invalid():
-    """Test parsing invalid version string."""
-    with pytest.raises(ValueError):
-        parse_version("invalid")
 
+def _raiser(error):
+    """Return a callable that raises ``error`` whatever it is called with."""
+
+    def raise_error(*args, **kwargs):
+        raise error
+
+    return raise_error
 
-def test_parse_version_single_number():
-    """Test parsing version string with only one number."""
-    with pytest.raises(ValueError):
-        parse_version("3")
+
+@pytest.mark.parametrize(
+    ("version_str", "expected"),
+    [
+        ("3.11.7", (3, 11, 7)),
+        ("2.45.0", (2, 45, 0)),
+        ("v3.11.7", (3, 11, 7)),
+        ("v2.45.0", (2, 45, 0)),
+        ("3.11", (3, 11, 0)),
+    ],
+)
+def test_parse_version(version_str, expected):
+    """Test parsing well-formed version strings, with or without prefix and patch."""
+    assert parse_version(version_str) == expected
 
 
-def test_parse_version_non_numeric():
-    """Test parsing version string with non-numeric parts."""
+@pytest.mark.parametrize("version_str", ["invalid", "3", "3.abc.7"])
+def test_parse_version_rejects_malformed(version_str):
+    """Test parsing malformed version strings raises ValueError."""
     with pytest.raises(ValueError):
-        parse_version("3.abc.7")
+        parse_version(version_str)
 
 
+@pytest.mark.skipif(FAST, reason="fast mode: reflects the running interpreter")
 def test_check_python_version_passes():
     """Test that Python version check passes for current Python."""
     result = check_python_version()
@@ -65,88 +128,68 @@ def test_check_python_version_passes():
     assert result.name == "Python Version"
 
 
-def test_check_python_version_fails():
+def test_check_python_version_fails(monkeypatch):
     """Test Python version check with old Python version."""
-    # Mock sys.version_info to simulate old Python
-    with patch("sys.version_info", (3, 8, 0)):
-        result = check_python_version()
-        assert result.passed is False
-        assert "Python 3.8.0" in result.message
-        assert result.suggestion is not None
-
-
-def test_check_git_installed_success():
-    """Test git installed check when git is available."""
-    with patch("shutil.which", return_value="/usr/bin/git"):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(stdout="git version 2.39.0\n")
-            result = check_git_installed()
-            assert result.passed is True
-            assert "git version" in result.message
-
-
-def test_check_git_installed_not_found():
-    """Test git installed check when git is not in PATH."""
-    with patch("shutil.which", return_value=None):
-        result = check_git_installed()
-        assert result.passed is False
-        assert "not found in PATH" in result.message
-        assert result.suggestion is not None
-
-
-def test_check_git_installed_error():
-    """Test git installed check when git command fails."""
-    with patch("shutil.which", return_value="/usr/bin/git"):
-        with patch("subprocess.run", side_effect=subprocess.CalledProcessError(1, "git")):
-            result = check_git_installed()
-            assert result.passed is False
-            assert "not working correctly" in result.message
-
-
-def test_check_git_installed_timeout():
-    """Test git installed check when git command times out."""
-    with patch("shutil.which", return_value="/usr/bin/git"):
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("git", 5)):
-            result = check_git_installed()
-            assert result.passed is False
-            assert "not working correctly" in result.message
-
-
-def test_check_session_directory_missing(tmp_path, monkeypatch):
+    monkeypatch.setattr(doc.sys, "version_info", (3, 8, 0))
+    result = check_python_version()
+    assert result.passed is False
+    assert "Python 3.8.0" in result.message
+    assert result.suggestion is not None
+
+
+@pytest.mark.parametrize(
+    ("installed", "run_error", "passed", "expected"),
+    [
+        (("git",), None, True, "git version"),
+        ((), None, False, "not found in PATH"),
+        (("git",), subprocess.CalledProcessError(1, "git"), False, "not working correctly"),
+        (("git",), subprocess.TimeoutExpired("git", 5), False, "not working correctly"),
+    ],
+    ids=["success", "not_found", "error", "timeout"],
+)
+def test_check_git_installed(monkeypatch, which_stub, installed, run_error, passed, expected):
+    """Test git installed check across availability and failure modes."""
+    which_stub(*installed)
+    if run_error is None:
+        monkeypatch.setattr(doc.subprocess, "run", lambda *args, **kwargs: _GIT_VERSION_RESULT)
+    else:
+        monkeypatch.setattr(doc.subprocess, "run", _raiser(run_error))
+    result = check_git_installed()
+    assert result.passed is passed
+    assert expected in result.message
+    assert (result.suggestion is None) is passed
+
+
+def test_check_session_directory_missing(session_trees, monkeypatch):
     """Test session directory check when .session doesn't exist."""
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.chdir(session_trees["empty"])
     result = check_session_directory()
     assert result.passed is False
     assert "directory not found" in result.message
     assert result.suggestion is not None
 
 
-def test_check_session_directory_missing_config(tmp_path, monkeypatch):
+def test_check_session_directory_missing_config(session_trees, monkeypatch):
     """Test session directory check when config.json is missing."""
-    session_dir = tmp_path / ".session"
-    session_dir.mkdir()
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.chdir(session_trees["session_only"])
 
     result = check_session_directory()
     assert result.passed is False
     assert "missing config.json" in result.message
 
 
-def test_check_session_directory_success(tmp_path, monkeypatch):
+def test_check_session_directory_success(session_trees, monkeypatch):
     """Test session directory check when everything exists."""
-    session_dir = tmp_path / ".session"
-    session_dir.mkdir()
-    (session_dir / "config.json").write_text("{}")
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.chdir(session_trees["session_empty_config"])
 
     result = check_session_directory()
     assert result.passed is True
     assert "exists with config.json" in result.message
 
 
-def test_check_config_valid_missing(tmp_path, monkeypatch):
+def test_check_config_valid_missing(session_trees, monkeypatch):
     """Test config validation when config.json doesn't exist."""
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.chdir(session_trees["empty"])
     result = check_config_valid()
     assert result.passed is False
     assert "not found" in result.message
@@ -178,26 +221,18 @@ def test_check_config_valid_not_dict(tmp_path, monkeypatch):
     assert "not a valid object" in result.message
 
 
-def test_check_config_valid_empty(tmp_path, monkeypatch):
+def test_check_config_valid_empty(session_trees, monkeypatch):
     """Test config validation when config is empty."""
-    session_dir = tmp_path / ".session"
-    session_dir.mkdir()
-    config_file = session_dir / "config.json"
-    config_file.write_text("{}")
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.chdir(session_trees["session_empty_config"])
 
     result = check_config_valid()
     assert result.passed is False
     assert "empty" in result.message
 
 
-def test_check_config_valid_success(tmp_path, monkeypatch):
+def test_check_config_valid_success(session_trees, monkeypatch):
     """Test config validation with valid config."""
-    session_dir = tmp_path / ".session"
-    session_dir.mkdir()
-    config_file = session_dir / "config.json"
-    config_file.write_text('{"test": "data"}')
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.chdir(session_trees["session_valid_config"])
 
     result = check_config_valid()
     assert result.passed is True
@@ -206,34 +241,26 @@ def test_check_config_valid_success(tmp_path, monkeypatch):
 
 def test_check_config_valid_read_error(tmp_path, monkeypatch):
     """Test config validation when file read error occurs."""
-    session_dir = tmp_path / ".session"
-    session_dir.mkdir()
-    config_file = session_dir / "config.json"
-    config_file.write_text('{"test": "data"}')
+    # A directory in place of the file makes the real open() raise IsADirectoryError
+    (tmp_path / ".session" / "config.json").mkdir(parents=True)
     monkeypatch.chdir(tmp_path)
 
-    # Mock open to raise an exception
-    with patch("builtins.open", side_effect=PermissionError("Permission denied")):
-        result = check_config_valid()
-        assert result.passed is False
-        assert "Error reading" in result.message
+    result = check_config_valid()
+    assert result.passed is False
+    assert "Error reading" in result.message
 
 
-def test_check_work_items_valid_missing(tmp_path, monkeypatch):
+def test_check_work_items_valid_missing(session_trees, monkeypatch):
     """Test work items validation when file doesn't exist."""
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.chdir(session_trees["empty"])
     result = check_work_items_valid()
     assert result.passed is True
     assert "will be created when needed" in result.message
 
 
-def test_check_work_items_valid_success(tmp_path, monkeypatch):
+def test_check_work_items_valid_success(session_trees, monkeypatch):
     """Test work items validation with valid file."""
-    session_dir = tmp_path / ".session"
-    session_dir.mkdir()
-    work_items_file = session_dir / "work_items.json"
-    work_items_file.write_text('[{"id": "WI-001", "title": "Test"}]')
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.chdir(session_trees["session_with_work_items"])
 
     result = check_work_items_valid()
     assert result.passed is True
@@ -268,129 +295,125 @@ def test_check_work_items_valid_invalid_json(tmp_path, monkeypatch):
 
 def test_check_work_items_valid_read_error(tmp_path, monkeypatch):
     """Test work items validation when file read error occurs."""
-    session_dir = tmp_path / ".session"
-    session_dir.mkdir()
-    work_items_file = session_dir / "work_items.json"
-    work_items_file.write_text("[]")
+    # A directory in place of the file makes the real open() raise IsADirectoryError
+    (tmp_path / ".session" / "work_items.json").mkdir(parents=True)
     monkeypatch.chdir(tmp_path)
 
-    # Mock open to raise an exception
-    with patch("builtins.open", side_effect=PermissionError("Permission denied")):
-        result = check_work_items_valid()
-        assert result.passed is False
-        assert "Error reading" in result.message
-
-
-def test_check_quality_tools_all_available():
-    """Test quality tools check when all tools are available."""
-    with patch("shutil.which", return_value="/usr/bin/tool"):
-        result = check_quality_tools()
-        assert result.passed is True
-        assert "All quality tools available" in result.message
-
-
-def test_check_quality_tools_some_missing():
-    """Test quality tools check when some tools are missing."""
-
-    def mock_which(tool):
-        return "/usr/bin/pytest" if tool == "pytest" else None
-
-    with patch("shutil.which", side_effect=mock_which):
-        result = check_quality_tools()
-        assert result.passed is False
-        assert "Some tools missing" in result.message
-        assert "ruff" in result.message
-
-
-def test_check_quality_tools_none_available():
-    """Test quality tools check when no tools are available."""
-    with patch("shutil.which", return_value=None):
-        result = check_quality_tools()
-        assert result.passed is False
-        assert "No quality tools found" in result.message
-
-
-def test_print_diagnostic_results_all_passed(capsys):
-    """Test printing diagnostic results when all checks pass."""
-    checks = [
-        DiagnosticCheck(name="Test 1", passed=True, message="Test 1 passed"),
-        DiagnosticCheck(name="Test 2", passed=True, message="Test 2 passed"),
-    ]
-    print_diagnostic_results(checks, verbose=False)
-
-    captured = capsys.readouterr()
-    assert "Running system diagnostics" in captured.out
-    assert "Test 1 passed" in captured.out
-    assert "Test 2 passed" in captured.out
-    assert "All 2 checks passed" in captured.out
-
-
-def test_print_diagnostic_results_some_failed(capsys):
-    """Test printing diagnostic results when some checks fail."""
-    checks = [
-        DiagnosticCheck(name="Test 1", passed=True, message="Test 1 passed"),
-        DiagnosticCheck(name="Test 2", passed=False, message="Test 2 failed", suggestion="Fix it"),
-    ]
-    print_diagnostic_results(checks, verbose=False)
-
-    captured = capsys.readouterr()
-    assert "Test 1 passed" in captured.out
-    assert "Test 2 failed" in captured.out
-    assert "Fix it" in captured.out
-    assert "1/2 checks passed (1 failed)" in captured.out
-    assert "Run with --verbose" in captured.out
-
-
-def test_print_diagnostic_results_verbose(capsys):
-    """Test printing diagnostic results in verbose mode."""
-    checks = [
-        DiagnosticCheck(name="Test", passed=False, message="Test failed", suggestion="Fix it"),
-    ]
-    print_diagnostic_results(checks, verbose=True)
-
-    captured = capsys.readouterr()
-    assert "Test failed" in captured.out
-    assert "Fix it" in captured.out
-    # Should not show verbose message when verbose=True
-    assert "Run with --verbose" not in captured.out
-
-
-def test_run_diagnostics_returns_exit_code(capsys):
-    """Test that run_diagnostics returns appropriate exit code."""
-    result = run_diagnostics(verbose=False)
-    # Result should be 0 or 1
-    assert result in [0, 1]
-
-    captured = capsys.readouterr()
-    assert "Running system diagnostics" in captured.out
-    assert "checks passed" in captured.out
-
-
-def test_run_diagnostics_verbose(capsys):
-    """Test run_diagnostics with verbose flag."""
-    result = run_diagnostics(verbose=True)
-    assert result in [0, 1]
-
-    captured = capsys.readouterr()
-    assert "Running system diagnostics" in captured.out
-
-
-def test_main_default(capsys):
-    """Test main function with no arguments."""
-    with patch.object(sys, "argv", ["doctor"]):
-        result = main()
-        assert result in [0, 1]
-
-
-def test_main_verbose_flag(capsys):
-    """Test main function with --verbose flag."""
-    with patch.object(sys, "argv", ["doctor", "--verbose"]):
-        result = main()
-        assert result in [0, 1]
+    result = check_work_items_valid()
+    assert result.passed is False
+    assert "Error reading" in result.message
 
 
-def test_main_v_flag(capsys):
-    """Test main function with -v flag."""
-    with patch.object(sys, "argv", ["doctor", "-v"]):
-        result = main()
-        assert result in [0, 1]
+@pytest.mark.parametrize(
+    ("installed", "passed", "expected"),
+    [
+        (("pytest", "ruff"), True, ["All quality tools available"]),
+        (("pytest",), False, ["Some tools missing", "ruff"]),
+        ((), False, ["No quality tools found"]),
+    ],
+    ids=["all_available", "some_missing", "none_available"],
+)
+def test_check_quality_tools(which_stub, installed, passed, expected):
+    """Test quality tools check with different tools on PATH."""
+    which_stub(*installed)
+    result = check_quality_tools()
+    assert result.passed is passed
+    missing = [text for text in expected if text not in result.message]
+    assert not missing, missing
+
+
+_PASS = DiagnosticCheck(name="Test 1", passed=True, message="Test 1 passed")
+_FAIL = DiagnosticCheck(name="Test 2", passed=False, message="Test 2 failed", suggestion="Fix it")
+
+_EXPECT_ALL_PASSED = (
+    "Running system diagnostics",
+    "Test 1 passed",
+    "Test 2 passed",
+    "All 2 checks passed",
+)
+_EXPECT_SOME_FAILED = (
+    "Test 1 passed",
+    "Test 2 failed",
+    "Fix it",
+    "1/2 checks passed (1 failed)",
+    "Run with --verbose",
+)
+_EXPECT_VERBOSE = ("Test 2 failed", "Fix it")
+
+
+@pytest.mark.parametrize(
+    ("checks", "verbose", "must_contain", "must_not_contain"),
+    [
+        (
+            [_PASS, DiagnosticCheck(name="Test 2", passed=True, message="Test 2 passed")],
+            False,
+            _EXPECT_ALL_PASSED,
+            (),
+        ),
+        ([_PASS, _FAIL], False, _EXPECT_SOME_FAILED, ()),
+        # Should not show verbose message when verbose=True
+        ([_FAIL], True, _EXPECT_VERBOSE, ("Run with --verbose",)),
+    ],
+    ids=["all_passed", "some_failed", "verbose"],
+)
+def test_print_diagnostic_results(checks, verbose, must_contain, must_not_contain, capsys):
+    """Test printing diagnostic results for passing, failing and verbose runs."""
+    print_diagnostic_results(checks, verbose=verbose)
+
+    out = capsys.readouterr().out
+    missing = [text for text in must_contain if text not in out]
+    assert not missing, missing
+    unexpected = [text for text in must_not_contain if text in out]
+    assert not unexpected, unexpected
+
+
+@pytest.fixture(scope="class")
+def stub_expensive_checks():
+    """Keep git and PATH lookups out of the full diagnostic pipeline."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(doc.subprocess, "run", lambda *args, **kwargs: _GIT_VERSION_RESULT)
+        mp.setattr(doc.shutil, "which", lambda name: f"/usr/bin/{name}")
+        yield
+
+
+@pytest.mark.usefixtures("stub_expensive_checks")
+class TestRunDiagnostics:
+    """Test the run_diagnostics and main entry points with external probes stubbed."""
+
+    @pytest.fixture(autouse=True)
+    def _in_initialized_project(self, tmp_path, monkeypatch, session_template):
+        """Run each test from a fresh project mirrored from the shared template."""
+        _mirror(tmp_path, session_template)
+        monkeypatch.chdir(tmp_path)
+
+    def test_run_diagnostics_returns_exit_code(self, capsys):
+        """Test that run_diagnostics returns 0 when every check passes."""
+        result = run_diagnostics(verbose=False)
+        assert result == 0
+
+        captured = capsys.readouterr()
+        assert "Running system diagnostics" in captured.out
+        assert "All 6 checks passed" in captured.out
+
+    def test_run_diagnostics_verbose(self, capsys):
+        """Test run_diagnostics with verbose flag."""
+        result = run_diagnostics(verbose=True)
+        assert result == 0
+
+        captured = capsys.readouterr()
+        assert "Running system diagnostics" in captured.out
+
+
+@pytest.mark.parametrize(
+    ("argv", "verbose"),
+    [(["doctor"], False), (["doctor", "--verbose"], True), (["doctor", "-v"], True)],
+    ids=["default", "verbose_flag", "v_flag"],
+)
+def test_main_parses_verbose(monkeypatch, argv, verbose):
+    """Test main forwards the verbose flag to run_diagnostics and returns its exit code."""
+    calls = []
+    monkeypatch.setattr(doc, "run_diagnostics", lambda verbose: calls.append(verbose) or 0)
+    monkeypatch.setattr(doc.sys, "argv", argv)
+
+    assert main() == 0
+    assert calls == [verbose]
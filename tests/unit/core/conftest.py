@@ -0,0 +1,15 @@
+"""
+Shared fixtures for core module tests.
+
+All tests in tests/unit/core/ can use these fixtures.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def fake_sleep(monkeypatch):
+    """Record time.sleep delays instead of sleeping."""
+    calls = []
+    monkeypatch.setattr("time.sleep", calls.append)
+    return calls
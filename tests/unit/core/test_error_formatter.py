@@ -2,6 +2,8 @@
 
 from io import StringIO
 
+import pytest
+
 from solokit.core.error_formatter import (
     ErrorFormatter,
     format_info_message,
@@ -20,13 +22,18 @@ from solokit.core.exceptions import (
 )
 
 
+@pytest.fixture(scope="module")
+def not_found_error():
+    """Shared WorkItemNotFoundError; formatting never mutates it."""
+    return WorkItemNotFoundError("my_feature")
+
+
 class TestErrorFormatter:
     """Test ErrorFormatter class"""
 
-    def test_format_solokit_error_basic(self):
+    def test_format_solokit_error_basic(self, not_found_error):
         """Test formatting basic SolokitError"""
-        error = WorkItemNotFoundError("my_feature")
-        formatted = ErrorFormatter.format_error(error, verbose=False)
+        formatted = ErrorFormatter.format_error(not_found_error, verbose=False)
 
         assert "🔍" in formatted  # Not found symbol
         assert "my_feature" in formatted
@@ -85,6 +92,7 @@ class TestErrorFormatter:
         assert "❌" in formatted
         assert "ValueError" in formatted
         assert "Generic error" in formatted
+        assert formatted == "❌ ValueError: Generic error"  # No traceback unless verbose
 
     def test_format_generic_error_verbose(self):
         """Test verbose formatting of generic exception includes traceback"""
@@ -115,16 +123,16 @@ class TestErrorFormatter:
         for category, expected_symbol in symbols.items():
             assert ErrorFormatter._get_error_symbol(category) == expected_symbol
 
-    def test_print_error(self):
+    def test_print_error(self, not_found_error):
         """Test printing error to stream"""
-        error = WorkItemNotFoundError("my_feature")
         output = StringIO()
 
-        ErrorFormatter.print_error(error, verbose=False, file=output)
+        ErrorFormatter.print_error(not_found_error, verbose=False, file=output)
 
         result = output.getvalue()
         assert "my_feature" in result
         assert "🔍" in result
+        assert result == ErrorFormatter.format_error(not_found_error) + "\n"
 
     def test_get_exit_code_solokit_error(self):
         """Test exit code extraction from SolokitError"""
@@ -171,6 +179,9 @@ class TestFormatHelpers:
         assert "⚠️ Validation failed" in formatted
         assert "1. Missing field 'name'" in formatted
         assert "2. Invalid value for 'age'" in formatted
+        assert formatted == (
+            "⚠️ Validation failed\n\n  1. Missing field 'name'\n  2. Invalid value for 'age'"
+        )
 
     def test_format_validation_errors_no_header(self):
         """Test formatting validation errors without header"""
@@ -212,36 +223,40 @@ class TestErrorFormatterEdgeCases:
         error = ValidationError(message="Test error", context={"large_data": large_dict})
         formatted = ErrorFormatter.format_error(error, verbose=True)
 
-        # Should show truncation message for large dicts
+        # Should show the first 10 items, then a truncation message
+        assert "key9: value9" in formatted
+        assert "key10" not in formatted
         assert "... and 5 more items" in formatted
 
-    def test_print_error_with_closed_file(self):
+    def test_print_error_with_closed_file(self, not_found_error):
         """Test printing error when file is closed falls back to stdout"""
         from io import StringIO
 
-        error = WorkItemNotFoundError("my_feature")
         closed_file = StringIO()
         closed_file.close()
 
         # Should not raise - should handle gracefully
         # The function will try stdout as fallback
-        ErrorFormatter.print_error(error, verbose=False, file=closed_file)
+        ErrorFormatter.print_error(not_found_error, verbose=False, file=closed_file)
 
-    def test_print_error_both_streams_closed(self):
+    def test_print_error_both_streams_closed(self, not_found_error):
         """Test printing error when both stderr and stdout fail handles gracefully"""
         from unittest.mock import MagicMock, patch
 
-        error = WorkItemNotFoundError("my_feature")
+        closed_stderr = StringIO()
+        closed_stderr.close()
+        closed_stdout = StringIO()
+        closed_stdout.close()
 
         # Mock the logger to capture logging calls without writing to streams
         mock_logger = MagicMock()
 
         with (
-            patch("builtins.print", side_effect=ValueError("stream closed")),
+            patch("sys.stdout", closed_stdout),
             patch("logging.getLogger", return_value=mock_logger),
         ):
             # Should not raise - handles gracefully
-            ErrorFormatter.print_error(error, verbose=False)
+            ErrorFormatter.print_error(not_found_error, verbose=False, file=closed_stderr)
 
         # Verify the error was logged (logger.error was called)
         assert mock_logger.error.called or mock_logger.warning.called
@@ -26,6 +26,11 @@ from solokit.core.exceptions import FileNotFoundError as SolokitFileNotFoundErro
 from solokit.core.exceptions import TimeoutError as SolokitTimeoutError
 
 
+def _messages(caplog):
+    """Return the formatted messages of all captured log records."""
+    return [record.getMessage() for record in caplog.records]
+
+
 class TestWithRetryDecorator:
     """Test retry decorator"""
 
@@ -43,7 +48,7 @@ class TestWithRetryDecorator:
         assert result == "success"
         assert call_count == 1
 
-    def test_retry_until_success(self):
+    def test_retry_until_success(self, fake_sleep):
         """Test function succeeds after retries"""
         attempt_count = 0
 
@@ -58,8 +63,9 @@ class TestWithRetryDecorator:
         result = eventual_success()
         assert result == "success"
         assert attempt_count == 3
+        assert len(fake_sleep) == 2
 
-    def test_all_attempts_fail(self):
+    def test_all_attempts_fail(self, fake_sleep):
         """Test function fails after all attempts"""
         attempt_count = 0
 
@@ -73,24 +79,24 @@ class TestWithRetryDecorator:
             always_fails()
 
         assert attempt_count == 3
+        assert len(fake_sleep) == 2  # No sleep after the final attempt
 
-    def test_retry_with_backoff(self):
+    def test_retry_with_backoff(self, fake_sleep):
         """Test retry uses exponential backoff"""
-        timestamps = []
+        call_count = 0
 
         @with_retry(max_attempts=3, delay_seconds=0.1, backoff_multiplier=2.0)
         def failing_function():
-            timestamps.append(time.time())
+            nonlocal call_count
+            call_count += 1
             raise ValueError("Error")
 
         with pytest.raises(ValueError):
             failing_function()
 
-        # Check that delays increased (approximately)
-        assert len(timestamps) == 3
-        delay1 = timestamps[1] - timestamps[0]
-        delay2 = timestamps[2] - timestamps[1]
-        assert delay2 > delay1  # Second delay should be longer
+        # Second delay should be the first multiplied by the backoff
+        assert call_count == 3
+        assert fake_sleep == [0.1, 0.2]
 
     def test_retry_specific_exceptions_only(self):
         """Test retry only catches specified exceptions"""
@@ -122,7 +128,7 @@ class TestWithTimeoutDecorator:
     def test_function_times_out(self):
         """Test function raises timeout error"""
 
-        @with_timeout(seconds=1, operation_name="slow_operation")
+        @with_timeout(seconds=0.2, operation_name="slow_operation")
         def slow_function():
             time.sleep(3)
             return "should not reach here"
@@ -131,7 +137,7 @@ class TestWithTimeoutDecorator:
             slow_function()
 
         assert "slow_operation" in str(exc_info.value)
-        assert exc_info.value.context["timeout_seconds"] == 1
+        assert exc_info.value.context["timeout_seconds"] == 0.2
 
 
 class TestLogErrorsDecorator:
@@ -152,8 +158,7 @@ class TestLogErrorsDecorator:
         with pytest.raises(SystemError):
             raises_solokit_error()
 
-        assert "raises_solokit_error failed" in caplog.text
-        assert "Test system error" in caplog.text
+        assert "raises_solokit_error failed: Test system error" in _messages(caplog)
 
     def test_logs_validation_error_at_debug(self, caplog):
         """Test logging of ValidationError at DEBUG level (user input errors)"""
@@ -172,8 +177,7 @@ class TestLogErrorsDecorator:
         with pytest.raises(ValidationError):
             raises_validation_error()
 
-        assert "raises_validation_error failed" in caplog.text
-        assert "Test validation error" in caplog.text
+        assert "raises_validation_error failed: Test validation error" in _messages(caplog)
 
     def test_logs_notfound_error_at_debug(self, caplog):
         """Test logging of NotFoundError at DEBUG level (user input errors)"""
@@ -190,7 +194,22 @@ class TestLogErrorsDecorator:
         with pytest.raises(WorkItemNotFoundError):
             raises_notfound_error()
 
-        assert "raises_notfound_error failed" in caplog.text
+        assert any(m.startswith("raises_notfound_error failed: ") for m in _messages(caplog))
+
+    def test_validation_error_not_logged_when_debug_disabled(self, caplog):
+        """Test ValidationError produces no record when DEBUG is disabled"""
+        import logging
+
+        caplog.set_level(logging.INFO)
+
+        @log_errors()
+        def raises_validation_error():
+            raise ValidationError(message="Test validation error")
+
+        with pytest.raises(ValidationError):
+            raises_validation_error()
+
+        assert caplog.records == []
 
     def test_logs_generic_error(self, caplog):
         """Test logging of generic exception"""
@@ -202,7 +221,8 @@ class TestLogErrorsDecorator:
         with pytest.raises(ValueError):
             raises_generic_error()
 
-        assert "raises_generic_error failed with unexpected error" in caplog.text
+        expected = "raises_generic_error failed with unexpected error: Generic error"
+        assert expected in _messages(caplog)
 
     def test_successful_function_not_logged(self, caplog):
         """Test successful execution doesn't log errors"""
@@ -213,7 +233,7 @@ class TestLogErrorsDecorator:
 
         result = successful_function()
         assert result == "success"
-        assert "failed" not in caplog.text
+        assert not any("failed" in m for m in _messages(caplog))
 
 
 class TestConvertSubprocessErrors:
@@ -351,7 +371,7 @@ class TestErrorContext:
             with ErrorContext("test operation", cleanup=failing_cleanup):
                 raise ValidationError("Test error")
 
-        assert "Cleanup failed" in caplog.text
+        assert "Cleanup failed for test operation: Cleanup failed" in _messages(caplog)
 
 
 class TestSafeExecute:
@@ -384,7 +404,7 @@ class TestSafeExecute:
 
         with caplog.at_level(logging.WARNING, logger="solokit.core.error_handlers"):
             safe_execute(failing_func, default=None, log_errors=True)
-        assert "Optional operation failed" in caplog.text
+        assert "Optional operation failed: failing_func: Error" in _messages(caplog)
 
     def test_failed_execution_no_log(self, caplog):
         """Test failed execution doesn't log when disabled"""
@@ -393,7 +413,7 @@ class TestSafeExecute:
             raise ValueError("Error")
 
         safe_execute(failing_func, default=None, log_errors=False)
-        assert "Optional operation failed" not in caplog.text
+        assert not any("Optional operation failed" in m for m in _messages(caplog))
 
     def test_with_arguments(self):
         """Test safe_execute with function arguments"""
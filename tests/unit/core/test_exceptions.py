@@ -1,5 +1,7 @@
 """Unit tests for exception hierarchy"""
 
+import pytest
+
 from solokit.core.exceptions import (
     BranchNotFoundError,
     CircularDependencyError,
@@ -27,47 +29,72 @@ from solokit.core.exceptions import (
 )
 
 
+def _assert_error(error, category, code, context, message_terms, remediation_terms):
+    """Assert an error's classification, context subset and message/remediation text."""
+    assert error.category == category
+    assert error.code == code
+    assert {key: error.context[key] for key in context} == context
+    for term in message_terms:
+        assert term in error.message
+    for term in remediation_terms:
+        assert term in error.remediation
+
+
+_SPEC_ERRORS = ["Missing Overview section", "Missing acceptance criteria"]
+_CONFIG_ERRORS = ["Missing 'project_name' field", "Invalid 'version' value"]
+_UNCOMMITTED = ["M src/file.py", "?? new_file.py"]
+_CYCLE = ["feature_a", "feature_b", "feature_c", "feature_a"]
+
+
+@pytest.fixture(scope="module")
+def basic_solokit_error():
+    """SolokitError with only the required fields; tests read it without mutating."""
+    return SolokitError(
+        message="Test error",
+        code=ErrorCode.FILE_OPERATION_FAILED,
+        category=ErrorCategory.SYSTEM,
+    )
+
+
+@pytest.fixture(scope="module")
+def detailed_solokit_error():
+    """SolokitError carrying context and remediation; tests read it without mutating."""
+    return SolokitError(
+        message="Test error",
+        code=ErrorCode.FILE_OPERATION_FAILED,
+        category=ErrorCategory.SYSTEM,
+        context={"file": "/path/to/file", "operation": "write"},
+        remediation="Check file permissions",
+    )
+
+
+@pytest.fixture(scope="module")
+def detailed_error_dict(detailed_solokit_error):
+    """to_dict() of detailed_solokit_error, built once for the module."""
+    return detailed_solokit_error.to_dict()
+
+
 class TestSolokitError:
     """Test base SolokitError class"""
 
-    def test_basic_error_creation(self):
+    def test_basic_error_creation(self, basic_solokit_error):
         """Test creating a basic SolokitError"""
-        error = SolokitError(
-            message="Test error",
-            code=ErrorCode.FILE_OPERATION_FAILED,
-            category=ErrorCategory.SYSTEM,
-        )
-
-        assert error.message == "Test error"
-        assert error.code == ErrorCode.FILE_OPERATION_FAILED
-        assert error.category == ErrorCategory.SYSTEM
-        assert error.context == {}
-        assert error.remediation is None
-        assert error.cause is None
-
-    def test_error_with_context(self):
+        assert basic_solokit_error.message == "Test error"
+        assert basic_solokit_error.code == ErrorCode.FILE_OPERATION_FAILED
+        assert basic_solokit_error.category == ErrorCategory.SYSTEM
+        assert basic_solokit_error.context == {}
+        assert basic_solokit_error.remediation is None
+        assert basic_solokit_error.cause is None
+
+    def test_error_with_context(self, detailed_solokit_error):
         """Test error with context data"""
-        error = SolokitError(
-            message="Test error",
-            code=ErrorCode.FILE_OPERATION_FAILED,
-            category=ErrorCategory.SYSTEM,
-            context={"file": "/path/to/file", "operation": "write"},
-        )
-
-        assert error.context["file"] == "/path/to/file"
-        assert error.context["operation"] == "write"
+        assert detailed_solokit_error.context["file"] == "/path/to/file"
+        assert detailed_solokit_error.context["operation"] == "write"
 
-    def test_error_with_remediation(self):
+    def test_error_with_remediation(self, detailed_solokit_error):
         """Test error with remediation"""
-        error = SolokitError(
-            message="Test error",
-            code=ErrorCode.FILE_OPERATION_FAILED,
-            category=ErrorCategory.SYSTEM,
-            remediation="Check file permissions",
-        )
-
-        assert error.remediation == "Check file permissions"
-        assert "Check file permissions" in str(error)
+        assert detailed_solokit_error.remediation == "Check file permissions"
+        assert str(detailed_solokit_error) == "Test error\nRemediation: Check file permissions"
 
     def test_error_with_cause(self):
         """Test error with cause chain"""
@@ -81,247 +108,293 @@ class TestSolokitError:
 
         assert error.cause is original
 
-    def test_error_to_dict(self):
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [
+            ("message", "Test error"),
+            ("code", ErrorCode.FILE_OPERATION_FAILED.value),
+            ("code_name", "FILE_OPERATION_FAILED"),
+            ("category", "system"),
+            ("context", {"file": "/path/to/file", "operation": "write"}),
+            ("remediation", "Check file permissions"),
+        ],
+    )
+    def test_error_to_dict(self, detailed_error_dict, key, expected):
         """Test converting error to dictionary"""
-        error = SolokitError(
-            message="Test error",
-            code=ErrorCode.FILE_OPERATION_FAILED,
-            category=ErrorCategory.SYSTEM,
-            context={"file": "/path/to/file"},
-            remediation="Check permissions",
-        )
-
-        error_dict = error.to_dict()
-        assert error_dict["message"] == "Test error"
-        assert error_dict["code"] == ErrorCode.FILE_OPERATION_FAILED.value
-        assert error_dict["code_name"] == "FILE_OPERATION_FAILED"
-        assert error_dict["category"] == "system"
-        assert error_dict["context"]["file"] == "/path/to/file"
-        assert error_dict["remediation"] == "Check permissions"
-
-    def test_exit_code_mapping(self):
+        assert detailed_error_dict[key] == expected
+
+    @pytest.mark.parametrize(
+        ("error", "exit_code"),
+        [
+            pytest.param(ValidationError("test"), 2, id="validation"),
+            pytest.param(WorkItemNotFoundError("test"), 3, id="not_found"),
+            pytest.param(ConfigurationError("test"), 4, id="configuration"),
+            pytest.param(SystemError("test", code=ErrorCode.FILE_OPERATION_FAILED), 5, id="system"),
+            pytest.param(GitError("test", code=ErrorCode.GIT_COMMAND_FAILED), 6, id="git"),
+        ],
+    )
+    def test_exit_code_mapping(self, error, exit_code):
         """Test exit codes map correctly to categories"""
-        validation_error = ValidationError("test")
-        assert validation_error.exit_code == 2
-
-        not_found_error = WorkItemNotFoundError("test")
-        assert not_found_error.exit_code == 3
-
-        config_error = ConfigurationError("test")
-        assert config_error.exit_code == 4
-
-        system_error = SystemError("test", code=ErrorCode.FILE_OPERATION_FAILED)
-        assert system_error.exit_code == 5
-
-        git_error = GitError("test", code=ErrorCode.GIT_COMMAND_FAILED)
-        assert git_error.exit_code == 6
+        assert error.exit_code == exit_code
 
 
 class TestValidationErrors:
     """Test validation error hierarchy"""
 
-    def test_validation_error(self):
-        """Test basic ValidationError"""
-        error = ValidationError(
-            message="Invalid input",
-            code=ErrorCode.INVALID_WORK_ITEM_ID,
-            context={"work_item_id": "bad-id"},
-            remediation="Use alphanumeric characters",
+    @pytest.mark.parametrize(
+        ("error", "code", "context", "message_terms", "remediation_terms"),
+        [
+            pytest.param(
+                ValidationError(
+                    message="Invalid input",
+                    code=ErrorCode.INVALID_WORK_ITEM_ID,
+                    context={"work_item_id": "bad-id"},
+                    remediation="Use alphanumeric characters",
+                ),
+                ErrorCode.INVALID_WORK_ITEM_ID,
+                {"work_item_id": "bad-id"},
+                ("Invalid input",),
+                (),
+                id="validation_error",
+            ),
+            pytest.param(
+                SpecValidationError(work_item_id="my_feature", errors=_SPEC_ERRORS),
+                ErrorCode.SPEC_VALIDATION_FAILED,
+                {"work_item_id": "my_feature", "validation_errors": _SPEC_ERRORS, "error_count": 2},
+                (),
+                (".session/specs/my_feature.md",),
+                id="spec_validation_error",
+            ),
+        ],
+    )
+    def test_validation_error(self, error, code, context, message_terms, remediation_terms):
+        """Test validation errors carry their code, context and guidance"""
+        _assert_error(
+            error, ErrorCategory.VALIDATION, code, context, message_terms, remediation_terms
         )
 
-        assert error.category == ErrorCategory.VALIDATION
-        assert error.code == ErrorCode.INVALID_WORK_ITEM_ID
-        assert "Invalid input" in str(error)
-
-    def test_spec_validation_error(self):
-        """Test SpecValidationError"""
-        errors = ["Missing Overview section", "Missing acceptance criteria"]
-        error = SpecValidationError(work_item_id="my_feature", errors=errors)
-
-        assert error.category == ErrorCategory.VALIDATION
-        assert error.code == ErrorCode.SPEC_VALIDATION_FAILED
-        assert error.context["work_item_id"] == "my_feature"
-        assert error.context["validation_errors"] == errors
-        assert error.context["error_count"] == 2
-        assert ".session/specs/my_feature.md" in error.remediation
-
 
 class TestNotFoundErrors:
     """Test not found error hierarchy"""
 
-    def test_work_item_not_found_error(self):
-        """Test WorkItemNotFoundError"""
-        error = WorkItemNotFoundError("nonexistent_item")
-
-        assert error.category == ErrorCategory.NOT_FOUND
-        assert error.code == ErrorCode.WORK_ITEM_NOT_FOUND
-        assert "nonexistent_item" in error.message
-        assert "/work-list" in error.remediation
-
-    def test_file_not_found_error(self):
-        """Test FileNotFoundError"""
-        error = FileNotFoundError(file_path=".session/config.json", file_type="configuration")
-
-        assert error.category == ErrorCategory.NOT_FOUND
-        assert error.code == ErrorCode.FILE_NOT_FOUND
-        assert error.context["file_path"] == ".session/config.json"
-        assert error.context["file_type"] == "configuration"
-        assert ".session/config.json" in error.message
-
-    def test_session_not_found_error(self):
-        """Test SessionNotFoundError"""
-        error = SessionNotFoundError()
-
-        assert error.category == ErrorCategory.NOT_FOUND
-        assert error.code == ErrorCode.SESSION_NOT_FOUND
-        assert "/start" in error.remediation
+    @pytest.mark.parametrize(
+        ("error", "code", "context", "message_terms", "remediation_terms"),
+        [
+            pytest.param(
+                WorkItemNotFoundError("nonexistent_item"),
+                ErrorCode.WORK_ITEM_NOT_FOUND,
+                {},
+                ("nonexistent_item",),
+                ("/work-list",),
+                id="work_item_not_found",
+            ),
+            pytest.param(
+                FileNotFoundError(file_path=".session/config.json", file_type="configuration"),
+                ErrorCode.FILE_NOT_FOUND,
+                {"file_path": ".session/config.json", "file_type": "configuration"},
+                (".session/config.json",),
+                (),
+                id="file_not_found",
+            ),
+            pytest.param(
+                SessionNotFoundError(),
+                ErrorCode.SESSION_NOT_FOUND,
+                {},
+                (),
+                ("/start",),
+                id="session_not_found",
+            ),
+        ],
+    )
+    def test_not_found_error(self, error, code, context, message_terms, remediation_terms):
+        """Test not found errors carry their code, context and guidance"""
+        _assert_error(
+            error, ErrorCategory.NOT_FOUND, code, context, message_terms, remediation_terms
+        )
 
 
 class TestConfigurationErrors:
     """Test configuration error hierarchy"""
 
-    def test_configuration_error(self):
-        """Test basic ConfigurationError"""
-        error = ConfigurationError(
-            message="Invalid config value",
-            code=ErrorCode.INVALID_CONFIG_VALUE,
-            context={"key": "test_command", "value": None},
+    @pytest.mark.parametrize(
+        ("error", "code", "context", "message_terms", "remediation_terms"),
+        [
+            pytest.param(
+                ConfigurationError(
+                    message="Invalid config value",
+                    code=ErrorCode.INVALID_CONFIG_VALUE,
+                    context={"key": "test_command", "value": None},
+                ),
+                ErrorCode.INVALID_CONFIG_VALUE,
+                {},
+                (),
+                (),
+                id="configuration_error",
+            ),
+            pytest.param(
+                ConfigValidationError(config_path=".session/config.json", errors=_CONFIG_ERRORS),
+                ErrorCode.CONFIG_VALIDATION_FAILED,
+                {"config_path": ".session/config.json", "error_count": 2},
+                (),
+                ("configuration.md",),
+                id="config_validation_error",
+            ),
+        ],
+    )
+    def test_configuration_error(self, error, code, context, message_terms, remediation_terms):
+        """Test configuration errors carry their code, context and guidance"""
+        _assert_error(
+            error, ErrorCategory.CONFIGURATION, code, context, message_terms, remediation_terms
         )
 
-        assert error.category == ErrorCategory.CONFIGURATION
-        assert error.code == ErrorCode.INVALID_CONFIG_VALUE
-
-    def test_config_validation_error(self):
-        """Test ConfigValidationError"""
-        errors = ["Missing 'project_name' field", "Invalid 'version' value"]
-        error = ConfigValidationError(config_path=".session/config.json", errors=errors)
-
-        assert error.category == ErrorCategory.CONFIGURATION
-        assert error.code == ErrorCode.CONFIG_VALIDATION_FAILED
-        assert error.context["config_path"] == ".session/config.json"
-        assert error.context["error_count"] == 2
-        assert "configuration.md" in error.remediation
-
 
 class TestGitErrors:
     """Test git error hierarchy"""
 
-    def test_not_a_git_repo_error(self):
-        """Test NotAGitRepoError"""
-        error = NotAGitRepoError()
-
-        assert error.category == ErrorCategory.GIT
-        assert error.code == ErrorCode.NOT_A_GIT_REPO
-        assert "git init" in error.remediation
-
-    def test_not_a_git_repo_error_with_path(self):
-        """Test NotAGitRepoError with path"""
-        error = NotAGitRepoError(path="/some/path")
-
-        assert error.context["path"] == "/some/path"
-
-    def test_working_dir_not_clean_error(self):
-        """Test WorkingDirNotCleanError"""
-        changes = ["M src/file.py", "?? new_file.py"]
-        error = WorkingDirNotCleanError(changes=changes)
-
-        assert error.category == ErrorCategory.GIT
-        assert error.code == ErrorCode.WORKING_DIR_NOT_CLEAN
-        assert error.context["uncommitted_changes"] == changes
-        assert "stash" in error.remediation.lower()
-
-    def test_branch_not_found_error(self):
-        """Test BranchNotFoundError"""
-        error = BranchNotFoundError("feature-branch")
-
-        assert error.category == ErrorCategory.GIT
-        assert error.code == ErrorCode.BRANCH_NOT_FOUND
-        assert "feature-branch" in error.message
-        assert error.context["branch_name"] == "feature-branch"
+    @pytest.mark.parametrize(
+        ("error", "code", "context", "message_terms", "remediation_terms"),
+        [
+            pytest.param(
+                NotAGitRepoError(),
+                ErrorCode.NOT_A_GIT_REPO,
+                {},
+                (),
+                ("git init",),
+                id="not_a_git_repo",
+            ),
+            pytest.param(
+                NotAGitRepoError(path="/some/path"),
+                ErrorCode.NOT_A_GIT_REPO,
+                {"path": "/some/path"},
+                (),
+                ("git init",),
+                id="not_a_git_repo_with_path",
+            ),
+            pytest.param(
+                WorkingDirNotCleanError(changes=_UNCOMMITTED),
+                ErrorCode.WORKING_DIR_NOT_CLEAN,
+                {"uncommitted_changes": _UNCOMMITTED},
+                (),
+                ("stash",),
+                id="working_dir_not_clean",
+            ),
+            pytest.param(
+                BranchNotFoundError("feature-branch"),
+                ErrorCode.BRANCH_NOT_FOUND,
+                {"branch_name": "feature-branch"},
+                ("feature-branch",),
+                (),
+                id="branch_not_found",
+            ),
+        ],
+    )
+    def test_git_error(self, error, code, context, message_terms, remediation_terms):
+        """Test git errors carry their code, context and guidance"""
+        _assert_error(error, ErrorCategory.GIT, code, context, message_terms, remediation_terms)
 
 
 class TestSystemErrors:
     """Test system error hierarchy"""
 
-    def test_subprocess_error(self):
-        """Test SubprocessError"""
-        error = SubprocessError(
-            command="pytest tests/",
-            returncode=1,
-            stderr="FAILED tests/test_foo.py",
-            stdout="collected 10 items",
-        )
-
-        assert error.category == ErrorCategory.SYSTEM
-        assert error.code == ErrorCode.SUBPROCESS_FAILED
-        assert error.context["command"] == "pytest tests/"
-        assert error.context["returncode"] == 1
-        assert error.context["stderr"] == "FAILED tests/test_foo.py"
-
-    def test_timeout_error(self):
-        """Test TimeoutError"""
-        error = TimeoutError(operation="git fetch", timeout_seconds=30)
-
-        assert error.category == ErrorCategory.SYSTEM
-        assert error.code == ErrorCode.OPERATION_TIMEOUT
-        assert error.context["operation"] == "git fetch"
-        assert error.context["timeout_seconds"] == 30
-        assert "30s" in error.message
-
-    def test_command_execution_error(self):
-        """Test CommandExecutionError"""
-        error = CommandExecutionError(command="npm test", returncode=1, stderr="Test failed")
-
-        assert error.category == ErrorCategory.SYSTEM
-        assert error.code == ErrorCode.COMMAND_FAILED
-        assert error.context["command"] == "npm test"
+    @pytest.mark.parametrize(
+        ("error", "code", "context", "message_terms", "remediation_terms"),
+        [
+            pytest.param(
+                SubprocessError(
+                    command="pytest tests/",
+                    returncode=1,
+                    stderr="FAILED tests/test_foo.py",
+                    stdout="collected 10 items",
+                ),
+                ErrorCode.SUBPROCESS_FAILED,
+                {"command": "pytest tests/", "returncode": 1, "stderr": "FAILED tests/test_foo.py"},
+                (),
+                (),
+                id="subprocess_error",
+            ),
+            pytest.param(
+                TimeoutError(operation="git fetch", timeout_seconds=30),
+                ErrorCode.OPERATION_TIMEOUT,
+                {"operation": "git fetch", "timeout_seconds": 30},
+                ("30s",),
+                (),
+                id="timeout_error",
+            ),
+            pytest.param(
+                CommandExecutionError(command="npm test", returncode=1, stderr="Test failed"),
+                ErrorCode.COMMAND_FAILED,
+                {"command": "npm test"},
+                (),
+                (),
+                id="command_execution_error",
+            ),
+        ],
+    )
+    def test_system_error(self, error, code, context, message_terms, remediation_terms):
+        """Test system errors carry their code, context and guidance"""
+        _assert_error(error, ErrorCategory.SYSTEM, code, context, message_terms, remediation_terms)
 
 
 class TestDependencyErrors:
     """Test dependency error hierarchy"""
 
-    def test_circular_dependency_error(self):
-        """Test CircularDependencyError"""
-        cycle = ["feature_a", "feature_b", "feature_c", "feature_a"]
-        error = CircularDependencyError(cycle)
-
-        assert error.category == ErrorCategory.DEPENDENCY
-        assert error.code == ErrorCode.CIRCULAR_DEPENDENCY
-        assert error.context["cycle"] == cycle
-        assert "feature_a -> feature_b -> feature_c -> feature_a" in error.message
-
-    def test_unmet_dependency_error(self):
-        """Test UnmetDependencyError"""
-        error = UnmetDependencyError("feature_b", "feature_a")
-
-        assert error.category == ErrorCategory.DEPENDENCY
-        assert error.code == ErrorCode.UNMET_DEPENDENCY
-        assert error.context["work_item_id"] == "feature_b"
-        assert error.context["dependency_id"] == "feature_a"
-        assert "feature_a" in error.message
-        assert "feature_b" in error.message
+    @pytest.mark.parametrize(
+        ("error", "code", "context", "message_terms", "remediation_terms"),
+        [
+            pytest.param(
+                CircularDependencyError(_CYCLE),
+                ErrorCode.CIRCULAR_DEPENDENCY,
+                {"cycle": _CYCLE},
+                ("feature_a -> feature_b -> feature_c -> feature_a",),
+                (),
+                id="circular_dependency",
+            ),
+            pytest.param(
+                UnmetDependencyError("feature_b", "feature_a"),
+                ErrorCode.UNMET_DEPENDENCY,
+                {"work_item_id": "feature_b", "dependency_id": "feature_a"},
+                ("feature_a", "feature_b"),
+                (),
+                id="unmet_dependency",
+            ),
+        ],
+    )
+    def test_dependency_error(self, error, code, context, message_terms, remediation_terms):
+        """Test dependency errors carry their code, context and guidance"""
+        _assert_error(
+            error, ErrorCategory.DEPENDENCY, code, context, message_terms, remediation_terms
+        )
 
 
 class TestAlreadyExistsErrors:
     """Test already exists error hierarchy"""
 
-    def test_session_already_active_error(self):
-        """Test SessionAlreadyActiveError"""
-        error = SessionAlreadyActiveError("current_feature")
-
-        assert error.category == ErrorCategory.ALREADY_EXISTS
-        assert error.code == ErrorCode.SESSION_ALREADY_ACTIVE
-        assert error.context["current_work_item_id"] == "current_feature"
-        assert "/end" in error.remediation
-
-    def test_work_item_already_exists_error(self):
-        """Test WorkItemAlreadyExistsError"""
-        error = WorkItemAlreadyExistsError("my_feature")
-
-        assert error.category == ErrorCategory.ALREADY_EXISTS
-        assert error.code == ErrorCode.WORK_ITEM_ALREADY_EXISTS
-        assert error.context["work_item_id"] == "my_feature"
-        assert "work-show" in error.remediation
+    @pytest.mark.parametrize(
+        ("error", "code", "context", "message_terms", "remediation_terms"),
+        [
+            pytest.param(
+                SessionAlreadyActiveError("current_feature"),
+                ErrorCode.SESSION_ALREADY_ACTIVE,
+                {"current_work_item_id": "current_feature"},
+                (),
+                ("/end",),
+                id="session_already_active",
+            ),
+            pytest.param(
+                WorkItemAlreadyExistsError("my_feature"),
+                ErrorCode.WORK_ITEM_ALREADY_EXISTS,
+                {"work_item_id": "my_feature"},
+                (),
+                ("work-show",),
+                id="work_item_already_exists",
+            ),
+        ],
+    )
+    def test_already_exists_error(self, error, code, context, message_terms, remediation_terms):
+        """Test already exists errors carry their code, context and guidance"""
+        _assert_error(
+            error, ErrorCategory.ALREADY_EXISTS, code, context, message_terms, remediation_terms
+        )
 
 
 class TestQualityGateErrors:
@@ -29,6 +29,7 @@ from solokit.init.template_installer import (
     install_tier_files,
     load_template_registry,
     replace_placeholders,
+    replace_placeholders_in_bytes,
 )
 
 
@@ -255,6 +256,43 @@ class TestReplacePlaceholders:
 
         assert result == "my-app"
 
+    def test_replace_leaves_unknown_placeholders_and_braces(self):
+        """Test unknown placeholders and JSON braces pass through verbatim."""
+        content = '{"name": "{project_name}", "extra": "{unknown}", "obj": {}}'
+        replacements = {"project_name": "my-app"}
+
+        result = replace_placeholders(content, replacements)
+
+        assert result == '{"name": "my-app", "extra": "{unknown}", "obj": {}}'
+
+    def test_replace_does_not_expand_placeholders_in_values(self):
+        """Test substituted values are not rescanned for placeholders."""
+        content = "{project_description} / {project_name}"
+        replacements = {"project_description": "{project_name}", "project_name": "my-app"}
+
+        result = replace_placeholders(content, replacements)
+
+        assert result == "{project_name} / my-app"
+
+
+class TestReplacePlaceholdersInBytes:
+    """Tests for replace_placeholders_in_bytes()."""
+
+    def test_replace_in_bytes_preserves_surrounding_bytes(self):
+        """Test only placeholders change; other bytes and line endings are kept."""
+        content = b'{"name": "{project_name}", "x": "{unknown}"}\r\n\xc3\xa9'
+        replacements = {"project_name": "my-app"}
+
+        result = replace_placeholders_in_bytes(content, replacements)
+
+        assert result == b'{"name": "my-app", "x": "{unknown}"}\r\n\xc3\xa9'
+
+    def test_replace_in_bytes_encodes_non_ascii_values(self):
+        """Test non-ASCII replacement values are written as UTF-8."""
+        result = replace_placeholders_in_bytes(b"# {project_name}", {"project_name": "caf\u00e9"})
+
+        assert result == "# caf\u00e9".encode()
+
 
 class TestInstallBaseTemplate:
     """Tests for install_base_template()."""